@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 """Example usage of the authentication system."""
 
-import sys
-from pathlib import Path
-
-from src.auth import AuthManager, AuthScope, DotenvCredentialStore, KeyringCredentialStore
 
 def main():
     """Demonstrate the authentication system."""
+    # Imported here so importing this module (e.g. during test collection)
+    # does not load the auth stack
+    from src.auth import AuthManager, AuthScope, KeyringCredentialStore
+
     # Initialize auth manager with default configuration
     auth_manager = AuthManager()
     
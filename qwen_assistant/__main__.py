@@ -1,37 +1,81 @@
 """Main entry point for the Qwen Multi-Assistant system."""
-import argparse
 import logging
 import os
 import sys
+from typing import List, Optional
 
-from .ui import launch_ui
-
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
 logger = logging.getLogger(__name__)
 
 
-def run() -> None:
-    """Run the application from the command line."""
+def _parse_config_path(argv: List[str]) -> Optional[str]:
+    """
+    Get the configuration file path from the command line arguments.
+
+    The common invocations (no arguments, ``--config PATH`` or
+    ``--config=PATH``) are handled directly. Anything else, including
+    ``--help`` and invalid arguments, goes through argparse so usage and
+    error messages are unchanged; argparse is only imported in that case.
+
+    Args:
+        argv: Command line arguments without the program name
+
+    Returns:
+        Path to the configuration file, or None to use the defaults
+    """
+    if not argv:
+        return os.environ.get("QWEN_CONFIG_PATH")
+    if len(argv) == 2 and argv[0] == "--config" and not argv[1].startswith("-"):
+        return argv[1]
+    if len(argv) == 1 and argv[0].startswith("--config="):
+        return argv[0][len("--config=") :]
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Qwen Multi-Assistant")
     parser.add_argument(
         "--config",
         help="Path to configuration file",
         default=os.environ.get("QWEN_CONFIG_PATH"),
     )
-    args = parser.parse_args()
+    return parser.parse_args(argv).config
+
+
+def _install_uvloop() -> None:
+    """Use uvloop for asyncio event loops when it is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    import asyncio
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def run() -> None:
+    """Run the application from the command line."""
+    # Configure logging here rather than at import time, and leave any
+    # configuration made by an embedding application alone
+    if not logging.getLogger().hasHandlers():
+        logging.basicConfig(
+            level=logging.INFO,
+            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        )
+
+    config_path = _parse_config_path(sys.argv[1:])
+    _install_uvloop()
 
     try:
-        launch_ui(args.config)
+        # Imported here so --help and argument errors don't pay for Gradio
+        from .ui import launch_ui
+
+        launch_ui(config_path)
     except KeyboardInterrupt:
         logger.info("Application terminated by user")
     except Exception as e:  # pragma: no cover - unexpected failures
-        logger.exception(f"Unhandled exception: {e}")
+        logger.exception("Unhandled exception: %s", e)
         sys.exit(1)
 
 
 if __name__ == "__main__":  # pragma: no cover - manual start
     run()
-
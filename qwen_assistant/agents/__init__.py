@@ -1 +1,30 @@
-# Qwen Multi-Assistant Agent Initialization
+"""
+Agent initialization for the Qwen Multi-Assistant system.
+
+Agent classes are imported lazily on first attribute access so that
+importing one agent does not pull in the dependencies of all the others.
+"""
+import importlib
+from typing import Any
+
+# Maps exported names to the submodule that defines them
+_LAZY_IMPORTS = {
+    "BaseAgent": ".base",
+    "DesktopAgent": ".desktop",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import agent classes on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + __all__)
@@ -3,12 +3,28 @@ Base agent class for all specialized agents in the Qwen Multi-Assistant system.
 All specialized agents inherit from this class to ensure consistent interface.
 """
 from abc import ABC, abstractmethod
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, ClassVar, Optional, Tuple
 
 
 class BaseAgent(ABC):
     """Base class for all specialized agents in the Qwen Multi-Assistant system."""
     
+    # Agents keep their state in slots; subclasses declare their own
+    # __slots__ to stay free of a per-instance __dict__
+    __slots__ = ("config", "model_config", "name", "description")
+    
+    # Agent name, defaults to the class name for subclasses that don't set it
+    NAME: ClassVar[str] = "BaseAgent"
+    
+    # Capability descriptions, overridden by subclasses
+    CAPABILITIES: ClassVar[Tuple[str, ...]] = ()
+    
+    def __init_subclass__(cls, **kwargs: Any):
+        """Give subclasses without an explicit NAME their class name."""
+        super().__init_subclass__(**kwargs)
+        if "NAME" not in cls.__dict__:
+            cls.NAME = cls.__name__
+    
     def __init__(self, config: Dict[str, Any], model_config: Dict[str, Any]):
         """
         Initialize the base agent.
@@ -19,7 +35,7 @@ class BaseAgent(ABC):
         """
         self.config = config
         self.model_config = model_config
-        self.name = self.__class__.__name__
+        self.name = self.NAME
         self.description = "Base agent for Qwen Multi-Assistant"
         
     @abstractmethod
@@ -37,14 +53,14 @@ class BaseAgent(ABC):
         pass
     
     @property
-    def capabilities(self) -> List[str]:
+    def capabilities(self) -> Tuple[str, ...]:
         """
-        Return a list of capabilities this agent can perform.
+        Return the capabilities this agent can perform.
         
         Returns:
-            List of capability descriptions
+            Tuple of capability descriptions
         """
-        return []
+        return self.CAPABILITIES
     
     def can_handle(self, request: Dict[str, Any]) -> float:
         """
@@ -3,16 +3,268 @@ Desktop Agent implementation for the Qwen Multi-Assistant system.
 This agent handles file system and local machine operations using DesktopCommanderMCP.
 """
 import asyncio
+import functools
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import re
+import time
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import aiohttp
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 from .base import BaseAgent
 
 logger = logging.getLogger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _dumps(obj: Any) -> bytes:
+    """Serialize an MCP payload to JSON bytes, using orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    """Parse an MCP response body, using orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Keywords that suggest the Desktop Agent should handle a request
+DESKTOP_KEYWORDS = {
+    # High confidence keywords (0.4)
+    "high": [
+        "run command",
+        "execute command",
+        "terminal command",
+        "shell command",
+        "system command",
+        "search files",
+        "list directory",
+        "write file",
+        "read file",
+        "create file",
+        "edit file",
+        "delete file",
+        "rename file",
+    ],
+    # Medium confidence keywords (0.2)
+    "medium": [
+        "file",
+        "directory",
+        "folder",
+        "command",
+        "terminal",
+        "shell",
+        "run",
+        "execute",
+        "script",
+        "find",
+        "code",
+        "local",
+        "computer",
+    ],
+}
+
+
+def _keyword_pattern(keywords: List[str]) -> re.Pattern:
+    """
+    Compile keywords into a single pattern that is matched in one pass.
+
+    The alternation sits inside a lookahead, so findall() reports every
+    keyword occurrence, including ones that overlap, just like a series
+    of substring checks would.
+    """
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))")
+
+
+# Confidence weight of every keyword, with both tiers matched in one pass
+_KEYWORD_WEIGHTS = {
+    **{keyword: 0.2 for keyword in DESKTOP_KEYWORDS["medium"]},
+    **{keyword: 0.4 for keyword in DESKTOP_KEYWORDS["high"]},
+}
+_KEYWORDS = _keyword_pattern(list(_KEYWORD_WEIGHTS))
+
+# Keywords that select an action when a request doesn't name one. Single
+# words are matched against the query's words, phrases against its text.
+_KEYWORD_ACTIONS = {
+    "run": "execute_command",
+    "execute": "execute_command",
+    "read": "read_file",
+    "write": "write_file",
+    "save": "write_file",
+    "list": "list_directory",
+    "ls": "list_directory",
+}
+_PHRASE_ACTIONS = (
+    ("find files", "search_files"),
+    ("search files", "search_files"),
+    ("find code", "search_code"),
+    ("search code", "search_code"),
+    ("file info", "get_file_info"),
+)
+
+# Verbs stripped from a query to recover the command to execute
+_COMMAND_VERBS = re.compile(r"\b(?:run|execute)\b", re.IGNORECASE)
+
+# HTTP sessions shared by every agent in the process, so warm calls reuse
+# pooled keep-alive connections instead of reconnecting each time. They
+# are keyed by Unix socket path, with None for the TCP session.
+_SESSIONS: Dict[Optional[str], aiohttp.ClientSession] = {}
+_SESSION_USERS: Dict[Optional[str], int] = {}
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+_UNIX_SCHEME = "unix://"
+
+
+def _make_connector(unix_socket: Optional[str]) -> aiohttp.BaseConnector:
+    """Create a connection pool sized for bursts of MCP calls."""
+    if unix_socket:
+        return aiohttp.UnixConnector(path=unix_socket, limit=100, keepalive_timeout=300)
+    return aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=64,
+        keepalive_timeout=300,
+        ttl_dns_cache=300,
+        enable_cleanup_closed=True,
+    )
+
+
+def get_session(unix_socket: Optional[str] = None) -> aiohttp.ClientSession:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    Must be called with an event loop running. A session that has been
+    closed is replaced. Sessions created on another event loop are closed
+    on that loop and replaced.
+
+    Args:
+        unix_socket: Path of a Unix domain socket to connect through, or
+            None for a regular TCP session
+
+    Returns:
+        The shared aiohttp session
+    """
+    global _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION_LOOP is not loop:
+        # Sessions can't be used from another event loop
+        if _SESSIONS:
+            _discard_sessions(_SESSION_LOOP, list(_SESSIONS.values()))
+        _SESSIONS.clear()
+        _SESSION_USERS.clear()
+        _SESSION_LOOP = loop
+
+    session = _SESSIONS.get(unix_socket)
+    if session is None or session.closed:
+        session = aiohttp.ClientSession(
+            connector=_make_connector(unix_socket),
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+        _SESSIONS[unix_socket] = session
+        _SESSION_USERS[unix_socket] = 0
+    return session
+
+
+def _release_session(
+    unix_socket: Optional[str], session: aiohttp.ClientSession
+) -> bool:
+    """
+    Drop one use of a shared session.
+
+    Args:
+        unix_socket: Key the session was acquired under
+        session: The session being released
+
+    Returns:
+        True if it was the last use of a session that is still shared
+    """
+    if session is not _SESSIONS.get(unix_socket):
+        # Already replaced, e.g. after an event loop change
+        return False
+    _SESSION_USERS[unix_socket] -= 1
+    return _SESSION_USERS[unix_socket] <= 0
+
+
+async def _close_sessions(sessions: List[aiohttp.ClientSession]):
+    """Close the given sessions, logging rather than raising on failure."""
+    for session in sessions:
+        if not session.closed:
+            try:
+                await session.close()
+            except Exception as e:
+                logger.debug("Error closing HTTP session: %s", e)
+
+
+# Pending closes of sessions left over from another event loop
+_CLOSING: Set[Any] = set()
+
+
+def _discard_sessions(
+    loop: Optional[asyncio.AbstractEventLoop], sessions: List[aiohttp.ClientSession]
+):
+    """
+    Close sessions that belong to an event loop other than the running one.
+
+    Args:
+        loop: Event loop the sessions were created on
+        sessions: Sessions to close
+    """
+    if loop is None or loop.is_closed():
+        # Their connections went away with the loop; closing here only
+        # releases the session objects
+        future = asyncio.ensure_future(_close_sessions(sessions))
+    elif loop.is_running():
+        # The loop is still running in another thread
+        future = asyncio.run_coroutine_threadsafe(_close_sessions(sessions), loop)
+    else:
+        # A stopped loop runs the close the next time it is run
+        future = loop.create_task(_close_sessions(sessions))
+    _CLOSING.add(future)
+    future.add_done_callback(_CLOSING.discard)
+
+
+async def close_session():
+    """Close all shared HTTP sessions."""
+    sessions = list(_SESSIONS.values())
+    _SESSIONS.clear()
+    _SESSION_USERS.clear()
+    if _SESSION_LOOP is asyncio.get_running_loop():
+        await _close_sessions(sessions)
+    elif sessions:
+        _discard_sessions(_SESSION_LOOP, sessions)
+
+
+# Recent results of idempotent MCP reads (read_file, get_file_info,
+# list_directory), shared by all agents. Keys are (endpoint, tool, path)
+# and values are (expiry, result serialized to JSON). Results are stored
+# serialized so every hit gets its own copy that callers are free to modify.
+_READ_CACHE: Dict[Tuple[str, str, str], Tuple[float, bytes]] = {}
+_READ_CACHE_TTL = 5.0
+_READ_CACHE_SIZE = 1024
+
+# Bumped on every invalidation, so a read that was in flight when cached
+# reads were dropped doesn't store its possibly stale result afterwards
+_READ_GENERATION = 0
+
+
+def clear_read_cache():
+    """Drop all cached MCP read results."""
+    global _READ_GENERATION
+    _READ_GENERATION += 1
+    _READ_CACHE.clear()
+
 
 class DesktopAgent(BaseAgent):
     """
@@ -26,6 +278,17 @@ class DesktopAgent(BaseAgent):
     - Get file metadata
     """
 
+    __slots__ = ("mcp_endpoint", "session", "_unix_socket", "_execute_url")
+
+    NAME = "DesktopAgent"
+    CAPABILITIES = (
+        "Execute terminal commands",
+        "Read and write files",
+        "Search for files and code",
+        "List directories and files",
+        "Get file metadata",
+    )
+
     def __init__(self, config: Dict[str, Any], model_config: Dict[str, Any]):
         """
         Initialize the Desktop Agent.
@@ -37,28 +300,30 @@ class DesktopAgent(BaseAgent):
         super().__init__(config, model_config)
         self.description = "Agent for file system and local machine operations"
         self.mcp_endpoint = config.get("mcp_endpoint", "http://localhost:9000")
+        if self.mcp_endpoint.startswith(_UNIX_SCHEME):
+            # e.g. unix:///var/run/mcp.sock; the host is ignored on a socket
+            self._unix_socket = self.mcp_endpoint[len(_UNIX_SCHEME) :]
+            self._execute_url = "http://localhost/api/v1/execute"
+        else:
+            self._unix_socket = None
+            self._execute_url = f"{self.mcp_endpoint}/api/v1/execute"
         self.session = None
 
     async def prepare(self):
-        """Initialize HTTP session for API calls."""
-        self.session = aiohttp.ClientSession()
+        """Acquire the shared HTTP session for API calls."""
+        if not self.session:
+            self.session = get_session(self._unix_socket)
+            _SESSION_USERS[self._unix_socket] += 1
 
     async def cleanup(self):
-        """Clean up HTTP session."""
-        if self.session:
-            await self.session.close()
-            self.session = None
-
-    @property
-    def capabilities(self) -> List[str]:
-        """Return the capabilities of the Desktop Agent."""
-        return [
-            "Execute terminal commands",
-            "Read and write files",
-            "Search for files and code",
-            "List directories and files",
-            "Get file metadata",
-        ]
+        """Release the shared HTTP session, closing it once no agent uses it."""
+        if not self.session:
+            return
+        session, self.session = self.session, None
+        key = self._unix_socket
+        if _release_session(key, session):
+            del _SESSIONS[key], _SESSION_USERS[key]
+            await session.close()
 
     def can_handle(self, request: Dict[str, Any]) -> float:
         """
@@ -70,63 +335,35 @@ class DesktopAgent(BaseAgent):
         Returns:
             Confidence score (0.0 to 1.0) for handling the request
         """
-        # Keywords that suggest this agent should handle the request
-        desktop_keywords = {
-            # High confidence keywords (0.4)
-            "high": [
-                "run command",
-                "execute command",
-                "terminal command",
-                "shell command",
-                "system command",
-                "search files",
-                "list directory",
-                "write file",
-                "read file",
-                "create file",
-                "edit file",
-                "delete file",
-                "rename file",
-            ],
-            # Medium confidence keywords (0.2)
-            "medium": [
-                "file",
-                "directory",
-                "folder",
-                "command",
-                "terminal",
-                "shell",
-                "run",
-                "execute",
-                "script",
-                "find",
-                "code",
-                "local",
-                "computer",
-            ],
-        }
+        return self._score_query(request.get("query", "").lower())
 
-        query = request.get("query", "").lower()
-        confidence = 0.0
+    @staticmethod
+    @functools.lru_cache(maxsize=2048)
+    def _score_query(query: str) -> float:
+        """
+        Score a lowercased query against the desktop keywords.
 
-        # Check for high confidence keywords first
-        for keyword in desktop_keywords["high"]:
-            if keyword in query:
-                confidence += 0.4
-                break
-        else:
-            # Additional check for phrases like "write ... file"
-            if "write" in query and "file" in query:
-                confidence += 0.4
+        The score only depends on the query text, so results are memoized
+        and repeated queries skip the keyword scan. lru_cache is thread-safe,
+        so the cache can be shared by all agent instances.
 
-        # If no high confidence keywords found, check medium ones
-        if confidence == 0.0:
-            for keyword in desktop_keywords["medium"]:
-                if keyword in query:
-                    confidence += 0.2
+        Args:
+            query: Lowercased user query
 
-        # Cap confidence at 1.0
-        return min(confidence, 1.0)
+        Returns:
+            Confidence score (0.0 to 1.0) for handling the query
+        """
+        weights = [
+            _KEYWORD_WEIGHTS[keyword] for keyword in set(_KEYWORDS.findall(query))
+        ]
+
+        # Any high confidence keyword, or a phrase like "write ... file",
+        # settles the score on its own
+        if 0.4 in weights or ("write" in query and "file" in query):
+            return 0.4
+
+        # Otherwise each distinct medium keyword adds 0.2, capped at 1.0
+        return min(sum(weights), 1.0)
 
     async def _mcp_call(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -139,27 +376,130 @@ class DesktopAgent(BaseAgent):
         Returns:
             Response from the MCP server
         """
-        if not self.session:
-            await self.prepare()
-
         try:
-            payload = {"tool": tool_name, "params": params}
+            body = _dumps({"tool": tool_name, "params": params})
+
+            # Always go through get_session, so a session prepared on another
+            # event loop or closed since is never used. Without a use held by
+            # prepare(), hold one for the call so a concurrent cleanup() by
+            # another agent can't close the session mid-request; it is left
+            # open afterwards for close_session() to close.
+            key = self._unix_socket
+            session = get_session(key)
+            borrowed = session is not self.session
+            if borrowed:
+                _SESSION_USERS[key] += 1
+            try:
+                async with session.post(
+                    self._execute_url, data=body, headers=_JSON_HEADERS
+                ) as response:
+                    # Parse the raw bytes directly instead of decoding to str first
+                    return _loads(await response.read())
+            finally:
+                if borrowed:
+                    _release_session(key, session)
+        except Exception as e:
+            logger.error("Error calling DesktopCommanderMCP: %s", e)
+            return {"error": str(e), "success": False}
+
+    async def _mcp_batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]], max_concurrent: int = 8
+    ) -> List[Dict[str, Any]]:
+        """
+        Make several independent calls to the DesktopCommanderMCP server at once.
+
+        The calls are sent as a single batch_execute request, so K independent
+        operations cost one round trip instead of K.
+
+        Args:
+            calls: (tool_name, params) pairs to execute
+            max_concurrent: Maximum number of operations the server runs in parallel
+
+        Returns:
+            One response per call, in the same order as the calls
+        """
+        if not calls:
+            return []
+
+        result = await self._mcp_call(
+            "batch_execute",
+            {
+                "ops": [{"tool": tool, "params": params} for tool, params in calls],
+                "maxConcurrent": max_concurrent,
+                "stopOnError": False,
+            },
+        )
 
-            post_result = self.session.post(
-                f"{self.mcp_endpoint}/api/v1/execute", json=payload
+        results = result.get("results")
+        if not isinstance(results, list) or len(results) != len(calls):
+            error = result.get(
+                "error", "Invalid batch response from DesktopCommanderMCP"
             )
+            return [{"error": error, "success": False} for _ in calls]
+        return results
 
-            if asyncio.iscoroutine(post_result):
-                response_ctx = await post_result
-            else:
-                response_ctx = post_result
+    async def _cached_read(self, tool_name: str, path: str) -> Dict[str, Any]:
+        """
+        Make an idempotent MCP read, reusing a recent result for the same path.
 
-            async with response_ctx as response:
-                result = await response.json()
-                return result
-        except Exception as e:
-            logger.error(f"Error calling DesktopCommanderMCP: {e}")
-            return {"error": str(e), "success": False}
+        Only successful results are cached, for a few seconds, so repeated
+        reads during a multi-step task skip the round trip to the server.
+
+        Args:
+            tool_name: Name of the read-only MCP tool to call
+            path: Path the tool operates on
+
+        Returns:
+            Response from the MCP server
+        """
+        key = (self.mcp_endpoint, tool_name, path)
+        entry = _READ_CACHE.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return _loads(entry[1])
+
+        generation = _READ_GENERATION
+        result = await self._mcp_call(tool_name, {"path": path})
+        if result.get("success") and generation == _READ_GENERATION:
+            if key not in _READ_CACHE and len(_READ_CACHE) >= _READ_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                del _READ_CACHE[next(iter(_READ_CACHE))]
+            _READ_CACHE[key] = (time.monotonic() + _READ_CACHE_TTL, _dumps(result))
+        return result
+
+    def _invalidate_reads(self, path: Optional[str] = None):
+        """
+        Drop cached reads that a change on the MCP server may have made stale.
+
+        Args:
+            path: Path that was written, or None if anything may have changed
+        """
+        global _READ_GENERATION
+        _READ_GENERATION += 1
+        stale = [
+            key
+            for key in _READ_CACHE
+            if key[0] == self.mcp_endpoint
+            and (path is None or key[2] == path or key[1] == "list_directory")
+        ]
+        for key in stale:
+            del _READ_CACHE[key]
+
+    async def execute_batch(
+        self, calls: List[Tuple[str, Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Execute several independent tool calls in one request.
+
+        Args:
+            calls: (tool_name, params) pairs, e.g. ("read_file", {"path": "a.txt"})
+
+        Returns:
+            One result per call, in the same order as the calls
+        """
+        results = await self._mcp_batch(calls)
+        # The batch may have contained writes or commands
+        self._invalidate_reads()
+        return results
 
     async def execute_command(self, command: str) -> Dict[str, Any]:
         """
@@ -171,7 +511,10 @@ class DesktopAgent(BaseAgent):
         Returns:
             Command execution result
         """
-        return await self._mcp_call("execute_command", {"command": command})
+        result = await self._mcp_call("execute_command", {"command": command})
+        # A command can change anything on disk
+        self._invalidate_reads()
+        return result
 
     async def read_file(self, file_path: str) -> Dict[str, Any]:
         """
@@ -183,7 +526,7 @@ class DesktopAgent(BaseAgent):
         Returns:
             File contents
         """
-        return await self._mcp_call("read_file", {"path": file_path})
+        return await self._cached_read("read_file", file_path)
 
     async def write_file(self, file_path: str, content: str) -> Dict[str, Any]:
         """
@@ -196,9 +539,11 @@ class DesktopAgent(BaseAgent):
         Returns:
             Result of the write operation
         """
-        return await self._mcp_call(
+        result = await self._mcp_call(
             "write_file", {"path": file_path, "content": content}
         )
+        self._invalidate_reads(file_path)
+        return result
 
     async def search_files(self, directory: str, pattern: str) -> Dict[str, Any]:
         """
@@ -240,7 +585,7 @@ class DesktopAgent(BaseAgent):
         Returns:
             Directory contents
         """
-        return await self._mcp_call("list_directory", {"path": directory})
+        return await self._cached_read("list_directory", directory)
 
     async def get_file_info(self, file_path: str) -> Dict[str, Any]:
         """
@@ -252,7 +597,152 @@ class DesktopAgent(BaseAgent):
         Returns:
             File metadata
         """
-        return await self._mcp_call("get_file_info", {"path": file_path})
+        return await self._cached_read("get_file_info", file_path)
+
+    async def _do_execute_command(
+        self, request: Dict[str, Any], query: str, response: Dict[str, Any]
+    ):
+        """Handle a request to run a terminal command."""
+        command = request.get("command", "")
+        if not command:
+            # Try to extract command from query
+            command = _COMMAND_VERBS.sub("", query).strip()
+
+        self._finalize(
+            response,
+            await self.execute_command(command),
+            f"Executed command: {command}",
+        )
+
+    async def _do_read_file(
+        self, request: Dict[str, Any], query: str, response: Dict[str, Any]
+    ):
+        """Handle a request to read a file."""
+        file_path = request.get("file_path", "")
+        if not file_path:
+            response["message"] = "No file path provided"
+            return
+
+        self._finalize(
+            response, await self.read_file(file_path), f"Read file: {file_path}"
+        )
+
+    async def _do_write_file(
+        self, request: Dict[str, Any], query: str, response: Dict[str, Any]
+    ):
+        """Handle a request to write a file."""
+        file_path = request.get("file_path", "")
+        content = request.get("content", "")
+        if not file_path or not content:
+            response["message"] = "File path or content not provided"
+            return
+
+        self._finalize(
+            response,
+            await self.write_file(file_path, content),
+            f"Wrote to file: {file_path}",
+        )
+
+    async def _do_search_files(
+        self, request: Dict[str, Any], query: str, response: Dict[str, Any]
+    ):
+        """Handle a request to search for files."""
+        directory = request.get("directory", ".")
+        pattern = request.get("pattern", "")
+        if not pattern:
+            response["message"] = "No search pattern provided"
+            return
+
+        self._finalize(
+            response,
+            await self.search_files(directory, pattern),
+            f"Searched for files: {pattern}",
+        )
+
+    async def _do_search_code(
+        self, request: Dict[str, Any], query: str, response: Dict[str, Any]
+    ):
+        """Handle a request to search code."""
+        directory = request.get("directory", ".")
+        query_text = request.get("code_query", "")
+        if not query_text:
+            response["message"] = "No code search query provided"
+            return
+
+        self._finalize(
+            response,
+            await self.search_code(directory, query_text),
+            f"Searched code for: {query_text}",
+        )
+
+    async def _do_list_directory(
+        self, request: Dict[str, Any], query: str, response: Dict[str, Any]
+    ):
+        """Handle a request to list a directory."""
+        directory = request.get("directory", ".")
+        self._finalize(
+            response,
+            await self.list_directory(directory),
+            f"Listed directory: {directory}",
+        )
+
+    async def _do_get_file_info(
+        self, request: Dict[str, Any], query: str, response: Dict[str, Any]
+    ):
+        """Handle a request for file metadata."""
+        file_path = request.get("file_path", "")
+        if not file_path:
+            response["message"] = "No file path provided"
+            return
+
+        self._finalize(
+            response,
+            await self.get_file_info(file_path),
+            f"Got info for file: {file_path}",
+        )
+
+    @staticmethod
+    def _finalize(
+        response: Dict[str, Any], result: Dict[str, Any], message: str
+    ) -> Dict[str, Any]:
+        """Record an MCP result and a message in the response."""
+        response["success"] = bool(result.get("success"))
+        response["data"] = result
+        response["message"] = message
+        return response
+
+    # Handlers for each action, in the priority used when a query's
+    # keywords point at more than one action
+    _ACTIONS = {
+        "execute_command": _do_execute_command,
+        "read_file": _do_read_file,
+        "write_file": _do_write_file,
+        "search_files": _do_search_files,
+        "search_code": _do_search_code,
+        "list_directory": _do_list_directory,
+        "get_file_info": _do_get_file_info,
+    }
+    _ACTION_PRIORITY = {action: i for i, action in enumerate(_ACTIONS)}
+
+    @classmethod
+    def _resolve_action(cls, query_lower: str) -> Optional[str]:
+        """
+        Pick the action a free-text query asks for.
+
+        Args:
+            query_lower: Lowercased user query
+
+        Returns:
+            The highest priority action matched by the query's keywords, or None
+        """
+        actions = [
+            _KEYWORD_ACTIONS[word]
+            for word in _KEYWORD_ACTIONS.keys() & query_lower.split()
+        ]
+        actions.extend(
+            action for phrase, action in _PHRASE_ACTIONS if phrase in query_lower
+        )
+        return min(actions, key=cls._ACTION_PRIORITY.__getitem__, default=None)
 
     async def handle_request(
         self, request: Dict[str, Any], context: Dict[str, Any]
@@ -272,93 +762,20 @@ class DesktopAgent(BaseAgent):
 
         # Initialize the response
         response = {
-            "agent": "DesktopAgent",
+            "agent": self.NAME,
             "success": False,
             "message": "",
             "data": None,
         }
 
-        try:
-            # Handle different actions based on the query and context
-            if action == "execute_command" or "run" in query or "execute" in query:
-                command = request.get("command", "")
-                if not command:
-                    # Try to extract command from query
-                    command = query.replace("run", "").replace("execute", "").strip()
-
-                result = await self.execute_command(command)
-                response["success"] = result.get("success", False)
-                response["data"] = result
-                response["message"] = f"Executed command: {command}"
-
-            elif action == "read_file" or "read" in query:
-                file_path = request.get("file_path", "")
-                if not file_path:
-                    response["message"] = "No file path provided"
-                else:
-                    result = await self.read_file(file_path)
-                    response["success"] = result.get("success", False)
-                    response["data"] = result
-                    response["message"] = f"Read file: {file_path}"
-
-            elif action == "write_file" or "write" in query or "save" in query:
-                file_path = request.get("file_path", "")
-                content = request.get("content", "")
-                if not file_path or not content:
-                    response["message"] = "File path or content not provided"
-                else:
-                    result = await self.write_file(file_path, content)
-                    response["success"] = result.get("success", False)
-                    response["data"] = result
-                    response["message"] = f"Wrote to file: {file_path}"
-
-            elif (
-                action == "search_files"
-                or "find files" in query
-                or "search files" in query
-            ):
-                directory = request.get("directory", ".")
-                pattern = request.get("pattern", "")
-                if not pattern:
-                    response["message"] = "No search pattern provided"
-                else:
-                    result = await self.search_files(directory, pattern)
-                    response["success"] = result.get("success", False)
-                    response["data"] = result
-                    response["message"] = f"Searched for files: {pattern}"
-
-            elif (
-                action == "search_code"
-                or "find code" in query
-                or "search code" in query
-            ):
-                directory = request.get("directory", ".")
-                query_text = request.get("code_query", "")
-                if not query_text:
-                    response["message"] = "No code search query provided"
-                else:
-                    result = await self.search_code(directory, query_text)
-                    response["success"] = result.get("success", False)
-                    response["data"] = result
-                    response["message"] = f"Searched code for: {query_text}"
-
-            elif action == "list_directory" or "list" in query or "ls" in query:
-                directory = request.get("directory", ".")
-                result = await self.list_directory(directory)
-                response["success"] = result.get("success", False)
-                response["data"] = result
-                response["message"] = f"Listed directory: {directory}"
-
-            elif action == "get_file_info" or "file info" in query:
-                file_path = request.get("file_path", "")
-                if not file_path:
-                    response["message"] = "No file path provided"
-                else:
-                    result = await self.get_file_info(file_path)
-                    response["success"] = result.get("success", False)
-                    response["data"] = result
-                    response["message"] = f"Got info for file: {file_path}"
+        # An explicit action wins; otherwise infer one from the query
+        if action not in self._ACTIONS:
+            action = self._resolve_action(query.lower())
 
+        try:
+            handler = self._ACTIONS.get(action)
+            if handler is not None:
+                await handler(self, request, query, response)
             else:
                 # General processing of query using LLM
                 # This would require integration with the Qwen LLM for more complex queries
@@ -366,8 +783,46 @@ class DesktopAgent(BaseAgent):
                 # Default handling could involve analyzing the query and determining which operation to perform
 
         except Exception as e:
-            logger.exception(f"Error handling desktop request: {e}")
+            logger.exception("Error handling desktop request: %s", e)
             response["success"] = False
             response["message"] = f"Error processing request: {str(e)}"
 
         return response
+
+    async def handle_requests(
+        self, requests: List[Dict[str, Any]], context: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Process several independent requests concurrently.
+
+        The requests' MCP calls are awaited together, so the total latency is
+        that of the slowest request rather than the sum of all of them. The
+        session is not prepared here: each call uses the shared pooled session
+        and holds it for its duration, so calling prepare() first is optional.
+
+        Args:
+            requests: The user requests to process
+            context: Context information from previous interactions
+
+        Returns:
+            One response per request, in the same order as the requests
+        """
+        results = await asyncio.gather(
+            *(self.handle_request(request, context) for request in requests),
+            return_exceptions=True,
+        )
+
+        # A cancelled sub-request comes back as CancelledError, which is not an
+        # Exception subclass, so it is checked for as a BaseException
+        responses = []
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error("Error handling desktop request: %s", result)
+                result = {
+                    "agent": self.NAME,
+                    "success": False,
+                    "message": f"Error processing request: {result}",
+                    "data": None,
+                }
+            responses.append(result)
+        return responses
@@ -1,13 +1,30 @@
 """
 Configuration management for the Qwen Multi-Assistant system.
 """
+import copy
+import functools
+import json
 import os
 import yaml
 from typing import Dict, Any, Optional
 import logging
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Immutable values that configuration copies can share
+_SCALAR_TYPES = (str, int, float, bool, type(None))
+
 # Default configuration
 DEFAULT_CONFIG = {
     # Model configurations
@@ -79,22 +96,23 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     Load configuration from file, environment variables, and defaults.
     
     Args:
-        config_path: Path to YAML configuration file
+        config_path: Path to YAML or JSON configuration file
         
     Returns:
         Merged configuration dictionary
     """
-    config = DEFAULT_CONFIG.copy()
-    
-    # Load from YAML file if provided
+    mtime_ns = 0
     if config_path and os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                file_config = yaml.safe_load(f)
-                if file_config:
-                    _deep_update(config, file_config)
-        except Exception as e:
-            logger.error(f"Error loading config file: {e}")
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError as e:
+            logger.error("Error loading config file: %s", e)
+            config_path = None
+    else:
+        config_path = None
+    
+    # Copy so callers cannot mutate the cached configuration
+    config = _copy_config(_load_file_config(config_path, mtime_ns))
     
     # Override with environment variables
     _update_from_env(config)
@@ -102,6 +120,82 @@ def load_config(config_path: Optional[str] = None) -> Dict[str, Any]:
     return config
 
 
+@functools.lru_cache(maxsize=8)
+def _load_file_config(config_path: Optional[str], mtime_ns: int) -> Dict[str, Any]:
+    """
+    Merge the defaults with a configuration file.
+    
+    Results are cached per path and modification time, so repeated loads
+    of an unchanged file skip the YAML parse and merge while edits are
+    picked up. Environment overrides are applied by the caller on every
+    load, so they are never cached.
+    
+    Args:
+        config_path: Path to YAML configuration file, or None for defaults only
+        mtime_ns: Modification time of the file in nanoseconds
+        
+    Returns:
+        Merged configuration dictionary, which must not be modified
+    """
+    config = _copy_config(DEFAULT_CONFIG)
+    
+    # Load from YAML file if provided
+    if config_path:
+        try:
+            file_config = _read_config_file(config_path)
+            if file_config:
+                _deep_update(config, file_config)
+        except Exception as e:
+            logger.error("Error loading config file: %s", e)
+    
+    return config
+
+
+def _copy_config(value: Any) -> Any:
+    """
+    Copy a configuration tree so it shares no mutable state with the original.
+    
+    Configuration is made of dicts, lists and scalars, so those are copied
+    directly, which is considerably faster than copy.deepcopy. Anything else
+    a YAML file may contain falls back to copy.deepcopy.
+    
+    Args:
+        value: Configuration value to copy
+        
+    Returns:
+        Independent copy of the value
+    """
+    if isinstance(value, dict):
+        return {key: _copy_config(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_config(item) for item in value]
+    if isinstance(value, _SCALAR_TYPES):
+        return value
+    return copy.deepcopy(value)
+
+
+def _read_config_file(config_path: str) -> Any:
+    """
+    Parse a YAML or JSON configuration file.
+    
+    Files ending in .json are parsed as JSON, which is much faster than
+    YAML; everything else is parsed as YAML.
+    
+    Args:
+        config_path: Path to configuration file
+        
+    Returns:
+        Parsed file contents
+    """
+    if config_path.lower().endswith(".json"):
+        with open(config_path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if orjson is not None else json.loads(data)
+    
+    with open(config_path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
+
+
 def _deep_update(target: Dict, source: Dict) -> Dict:
     """
     Update target dictionary with source values, recursively for nested dicts.
@@ -113,14 +207,42 @@ def _deep_update(target: Dict, source: Dict) -> Dict:
     Returns:
         Updated target dictionary
     """
-    for key, value in source.items():
-        if key in target and isinstance(target[key], dict) and isinstance(value, dict):
-            _deep_update(target[key], value)
-        else:
-            target[key] = value
+    # Walk nested dicts with an explicit stack instead of recursing
+    stack = [(target, source)]
+    while stack:
+        current, updates = stack.pop()
+        for key, value in updates.items():
+            existing = current.get(key)
+            if isinstance(existing, dict) and isinstance(value, dict):
+                stack.append((existing, value))
+            else:
+                current[key] = value
     return target
 
 
+# Environment variable overrides as (variable, parent keys, key, converter)
+_ENV_OVERRIDES = (
+    # Model configurations
+    ("QWEN_MODEL_ROUTER", ("models", "router"), "model", str),
+    ("QWEN_MODEL_AGENT", ("models", "agent"), "model", str),
+    
+    # MCP endpoints
+    ("QWEN_MCP_AIRTABLE_ENDPOINT", ("mcp_servers", "airtable"), "endpoint", str),
+    ("QWEN_MCP_DESKTOP_ENDPOINT", ("mcp_servers", "desktop"), "endpoint", str),
+    ("QWEN_MCP_EXA_ENDPOINT", ("mcp_servers", "exa"), "endpoint", str),
+    ("QWEN_MCP_CONTEXT7_ENDPOINT", ("mcp_servers", "context7"), "endpoint", str),
+    
+    # API keys
+    ("QWEN_API_KEY_AIRTABLE", ("mcp_servers", "airtable"), "api_key", str),
+    ("QWEN_API_KEY_EXA", ("mcp_servers", "exa"), "api_key", str),
+    ("QWEN_API_KEY_CONTEXT7", ("mcp_servers", "context7"), "api_key", str),
+    
+    # UI Configuration
+    ("QWEN_UI_PORT", ("ui",), "port", int),
+    ("QWEN_UI_TITLE", ("ui",), "title", str),
+)
+
+
 def _update_from_env(config: Dict[str, Any]) -> None:
     """
     Update configuration from environment variables.
@@ -134,42 +256,18 @@ def _update_from_env(config: Dict[str, Any]) -> None:
     Args:
         config: Configuration to update
     """
-    env_mappings = {
-        # Model configurations
-        "QWEN_MODEL_ROUTER": ("models", "router", "model"),
-        "QWEN_MODEL_AGENT": ("models", "agent", "model"),
-        
-        # MCP endpoints
-        "QWEN_MCP_AIRTABLE_ENDPOINT": ("mcp_servers", "airtable", "endpoint"),
-        "QWEN_MCP_DESKTOP_ENDPOINT": ("mcp_servers", "desktop", "endpoint"),
-        "QWEN_MCP_EXA_ENDPOINT": ("mcp_servers", "exa", "endpoint"),
-        "QWEN_MCP_CONTEXT7_ENDPOINT": ("mcp_servers", "context7", "endpoint"),
+    environ = os.environ
+    for env_var, parents, key, convert in _ENV_OVERRIDES:
+        value = environ.get(env_var)
+        if not value:
+            continue
         
-        # API keys
-        "QWEN_API_KEY_AIRTABLE": ("mcp_servers", "airtable", "api_key"),
-        "QWEN_API_KEY_EXA": ("mcp_servers", "exa", "api_key"),
-        "QWEN_API_KEY_CONTEXT7": ("mcp_servers", "context7", "api_key"),
+        # Navigate to the correct level in the config
+        target = config
+        for part in parents:
+            target = target[part]
         
-        # UI Configuration
-        "QWEN_UI_PORT": ("ui", "port"),
-        "QWEN_UI_TITLE": ("ui", "title"),
-    }
-    
-    for env_var, config_path in env_mappings.items():
-        value = os.environ.get(env_var)
-        if value:
-            # Navigate to the correct level in the config
-            target = config
-            for i, part in enumerate(config_path):
-                if i == len(config_path) - 1:
-                    # Convert port to int
-                    if part == "port":
-                        try:
-                            target[part] = int(value)
-                        except ValueError:
-                            logger.error(f"Invalid port value: {value}")
-                    else:
-                        target[part] = value
-                else:
-                    target = target[part]
-
+        try:
+            target[key] = convert(value)
+        except ValueError:
+            logger.error("Invalid value for %s: %s", env_var, value)
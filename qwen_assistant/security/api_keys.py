@@ -8,6 +8,7 @@ used by the application, including the main LLM API and various MCP servers.
 import json
 import logging
 import os
+import re
 from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional, Union
@@ -50,6 +51,12 @@ class ApiKeyManager:
         },
     }
 
+    # Format patterns compiled once for all instances
+    _FORMAT_PATTERNS = {
+        key_name: re.compile(definition["format"])
+        for key_name, definition in KEY_DEFINITIONS.items()
+    }
+
     def __init__(self, env_path: Optional[Union[str, Path]] = None):
         """
         Initialize the API key manager.
@@ -67,10 +74,12 @@ class ApiKeyManager:
         Args:
             env_path: Optional path to a .env file
         """
-        # Always check current environment first
+        # Always check current environment first, with one lookup per key
+        environ = os.environ
         for key_name in self.KEY_DEFINITIONS:
-            if key_name in os.environ:
-                self._keys[key_name] = os.environ[key_name]
+            value = environ.get(key_name)
+            if value is not None:
+                self._keys[key_name] = value
 
     def validate_keys(self) -> Dict[str, Dict]:
         """
@@ -79,8 +88,6 @@ class ApiKeyManager:
         Returns:
             Dictionary with validation results for each key
         """
-        import re
-
         results = {}
 
         for key_name, definition in self.KEY_DEFINITIONS.items():
@@ -94,7 +101,7 @@ class ApiKeyManager:
             if result["present"]:
                 # Validate format if key is present
                 result["valid"] = bool(
-                    re.match(definition["format"], self._keys[key_name])
+                    self._FORMAT_PATTERNS[key_name].match(self._keys[key_name])
                 )
 
             results[key_name] = result
@@ -102,10 +109,12 @@ class ApiKeyManager:
             # Log validation issues
             if definition["required"] and not result["present"]:
                 logger.error(
-                    f"Required API key missing: {key_name} ({definition['description']})"
+                    "Required API key missing: %s (%s)",
+                    key_name,
+                    definition["description"],
                 )
             elif result["present"] and not result["valid"]:
-                logger.error(f"API key has invalid format: {key_name}")
+                logger.error("API key has invalid format: %s", key_name)
 
         return results
 
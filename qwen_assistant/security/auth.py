@@ -11,6 +11,7 @@ import uuid
 import logging
 import hashlib
 import hmac
+from collections import OrderedDict
 from typing import Dict, Optional, Any, Tuple
 from functools import wraps
 
@@ -27,17 +28,30 @@ class Auth:
     - Token validation and rotation
     """
 
-    def __init__(self, secret_key: Optional[str] = None):
+    def __init__(self, secret_key: Optional[str] = None, max_sessions: int = 10000):
         """
         Initialize the authentication manager.
 
         Args:
             secret_key: Secret key for token generation and validation.
                         If None, a random key will be generated (not persisted).
+            max_sessions: Maximum number of sessions kept in memory, at least 1
+
+        Raises:
+            ValueError: If max_sessions is less than 1
         """
+        if max_sessions < 1:
+            raise ValueError("max_sessions must be at least 1")
+
         # Use provided secret key or generate a random one
         self._secret_key = secret_key or os.urandom(32).hex()
-        self._sessions = {}  # session_id -> session_data
+        self._secret_bytes = self._secret_key.encode("utf-8")
+        if len(self._secret_bytes) > hashlib.blake2b.MAX_KEY_SIZE:
+            # BLAKE2b keys are at most 64 bytes, so hash longer secrets down
+            self._secret_bytes = hashlib.blake2b(self._secret_bytes).digest()
+        # session_id -> session_data, least recently used first
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._max_sessions = max_sessions
 
     def create_session(self, user_id: str = "default") -> Dict[str, Any]:
         """
@@ -65,9 +79,44 @@ class Auth:
             "active": True,
         }
 
+        if len(self._sessions) >= self._max_sessions:
+            self._prune_sessions(created_at)
         self._sessions[session_id] = session
         return session
 
+    def _prune_sessions(self, now: int) -> None:
+        """
+        Make room for new sessions.
+
+        Expired and invalidated sessions are dropped first. If the store is
+        still above 90% of the limit, the least recently used sessions (by
+        creation or last successful validation) are evicted down to that
+        mark, so the full sweep runs once per batch of new sessions rather
+        than on every one.
+
+        Args:
+            now: Current time in seconds since the epoch
+        """
+        sessions = self._sessions
+        for session_id in [
+            session_id
+            for session_id, session in sessions.items()
+            if not session["active"] or now > session["expires_at"]
+        ]:
+            del sessions[session_id]
+
+        low_water = min(self._max_sessions * 9 // 10, self._max_sessions - 1)
+        evicted = 0
+        while len(sessions) > low_water:
+            # The first session is the least recently used
+            sessions.popitem(last=False)
+            evicted += 1
+        if evicted:
+            logger.info(
+                "Evicted %d least recently used sessions to stay within the limit",
+                evicted,
+            )
+
     def validate_token(
         self, access_token: str
     ) -> Tuple[bool, Optional[Dict[str, Any]]]:
@@ -80,33 +129,40 @@ class Auth:
         Returns:
             Tuple of (is_valid, session_data or None)
         """
-        # Parse token parts
+        # Parse token parts: session_id.user_id:timestamp.signature
         try:
-            parts = access_token.split(".")
-            if len(parts) != 3:
+            session_id, _, rest = access_token.partition(".")
+            payload, _, signature = rest.rpartition(".")
+            if not payload:
                 return False, None
 
-            session_id = parts[0]
-            signature = parts[2]
-
             # Check if session exists
-            if session_id not in self._sessions:
+            session = self._sessions.get(session_id)
+            if session is None:
                 return False, None
 
-            session = self._sessions[session_id]
-
             # Check if session is expired or inactive
-            if not session["active"] or int(time.time()) > session["expires_at"]:
+            if not session["active"]:
+                return False, None
+            if int(time.time()) > session["expires_at"]:
+                # Drop expired sessions as they are found
+                del self._sessions[session_id]
+                return False, None
+
+            # Verify the token was issued for this session's user
+            if payload.rpartition(":")[0] != session["user_id"]:
                 return False, None
 
-            # Verify signature
-            expected_token = self._generate_token(session_id, session["user_id"])
-            if access_token != expected_token:
+            # Verify signature in constant time
+            expected_signature = self._sign(session_id, payload)
+            if not hmac.compare_digest(signature, expected_signature):
                 return False, None
 
+            # Keep busy sessions away from eviction
+            self._sessions.move_to_end(session_id)
             return True, session
         except Exception as e:
-            logger.warning(f"Token validation error: {e}")
+            logger.warning("Token validation error: %s", e)
             return False, None
 
     def invalidate_session(self, session_id: str) -> bool:
@@ -140,17 +196,27 @@ class Auth:
         # Create payload part
         payload = f"{user_id}:{timestamp}"
 
-        # Create signature
-        payload_bytes = payload.encode("utf-8")
-        signature = hmac.new(
-            self._secret_key.encode("utf-8"),
+        # Combine parts
+        return f"{session_id}.{payload}.{self._sign(session_id, payload)}"
+
+    def _sign(self, session_id: str, payload: str) -> str:
+        """
+        Compute the signature of a token.
+
+        Args:
+            session_id: Session identifier
+            payload: Token payload (user_id:timestamp)
+
+        Returns:
+            Hex-encoded keyed BLAKE2b signature
+        """
+        # BLAKE2b is a MAC when keyed, so no HMAC construction is needed
+        return hashlib.blake2b(
             f"{session_id}.{payload}".encode("utf-8"),
-            hashlib.sha256,
+            key=self._secret_bytes,
+            digest_size=32,
         ).hexdigest()
 
-        # Combine parts
-        return f"{session_id}.{payload}.{signature}"
-
 
 # Singleton auth instance
 _auth_instance = None
@@ -194,6 +260,4 @@ def require_auth(f):
 
         return f(*args, **kwargs)
 
-
-
     return wrapped
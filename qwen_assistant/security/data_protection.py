@@ -5,7 +5,6 @@ This module provides functionality for protecting sensitive data
 during processing, storage, and transmission.
 """
 
-import json
 import logging
 from typing import Any, Dict, List, Union, Optional
 import re
@@ -31,6 +30,17 @@ class DataProtection:
         "phone": r'\b(?:\+\d{1,2}\s)?\(?\d{3}\)?[\s.-]?\d{3}[\s.-]?\d{4}\b',
     }
     
+    # Patterns compiled once, paired with their replacement. They are applied
+    # one after another in this order, so e.g. an API key is redacted before
+    # the email pattern can match part of it.
+    _SENSITIVE_RES = tuple(
+        (re.compile(pattern), f"[REDACTED-{name.upper()}]")
+        for name, pattern in SENSITIVE_PATTERNS.items()
+    )
+    
+    # Keys whose string values are always redacted, compared in lowercase
+    SENSITIVE_KEY_NAMES = frozenset({"api_key", "token", "password", "secret", "credential"})
+    
     def __init__(self):
         """Initialize the data protection manager."""
         pass
@@ -47,16 +57,12 @@ class DataProtection:
         """
         if not text:
             return text
-            
+        
         redacted = text
         
         # Apply each pattern and redact matches
-        for data_type, pattern in self.SENSITIVE_PATTERNS.items():
-            redacted = re.sub(
-                pattern, 
-                f"[REDACTED-{data_type.upper()}]", 
-                redacted
-            )
+        for pattern, replacement in self._SENSITIVE_RES:
+            redacted = pattern.sub(replacement, redacted)
             
         return redacted
     
@@ -64,6 +70,10 @@ class DataProtection:
         """
         Clean a request data dictionary to remove/redact sensitive information.
         
+        The original data is never modified. Only the dicts and lists on the
+        path to a redacted value are copied; everything else is shared with
+        the original, which is returned as is when nothing needs redacting.
+        
         Args:
             data: Request data dictionary
             
@@ -72,37 +82,44 @@ class DataProtection:
         """
         if not data:
             return data
-            
-        # Create a deep copy to avoid modifying the original
-        import copy
-        cleaned = copy.deepcopy(data)
         
-        # Recursively clean all string values
-        self._clean_dict_recursive(cleaned)
-        
-        return cleaned
+        return self._clean_value(data)
     
-    def _clean_dict_recursive(self, data: Any) -> None:
+    def _clean_value(self, data: Any) -> Any:
         """
-        Recursively clean a dictionary or list to redact sensitive information.
+        Redact sensitive keys in a dictionary or list, copying only on change.
         
         Args:
             data: Dictionary, list, or value to clean
+            
+        Returns:
+            A cleaned copy of data, or data itself if nothing was redacted
         """
         if isinstance(data, dict):
+            cleaned = None
             for key, value in data.items():
                 # Specifically handle known sensitive keys
-                if key.lower() in {"api_key", "token", "password", "secret", "credential"}:
-                    if isinstance(value, str) and value:
-                        data[key] = "[REDACTED]"
+                if isinstance(key, str) and key.lower() in self.SENSITIVE_KEY_NAMES:
+                    new_value = "[REDACTED]" if isinstance(value, str) and value else value
                 else:
-                    self._clean_dict_recursive(value)
-        elif isinstance(data, list):
+                    new_value = self._clean_value(value)
+                if new_value is not value:
+                    if cleaned is None:
+                        cleaned = dict(data)
+                    cleaned[key] = new_value
+            return data if cleaned is None else cleaned
+        
+        if isinstance(data, list):
+            cleaned = None
             for i, item in enumerate(data):
-                self._clean_dict_recursive(item)
-        elif isinstance(data, str):
-            # No direct replacement for simple strings - would need the parent to do it
-            pass
+                new_item = self._clean_value(item)
+                if new_item is not item:
+                    if cleaned is None:
+                        cleaned = list(data)
+                    cleaned[i] = new_item
+            return data if cleaned is None else cleaned
+        
+        return data
     
     def sanitize_logs(self, log_data: Union[str, Dict, List]) -> Union[str, Dict, List]:
         """
@@ -117,12 +134,44 @@ class DataProtection:
         if isinstance(log_data, str):
             return self.redact_text(log_data)
         elif isinstance(log_data, (dict, list)):
-            # Convert to JSON and back to handle nested structures
-            json_str = json.dumps(log_data)
-            redacted_str = self.redact_text(json_str)
-            return json.loads(redacted_str)
+            return self._sanitize_value(log_data)
         else:
             return log_data
+    
+    def _sanitize_value(self, data: Any) -> Any:
+        """
+        Build a sanitized copy of a nested log structure.
+        
+        Strings (including dict keys) are redacted with the sensitive data
+        patterns and string values of sensitive keys are redacted entirely.
+        Tuples become lists, as they would after a JSON round trip; other
+        values are returned unchanged.
+        
+        Args:
+            data: Dictionary, list, or value to sanitize
+            
+        Returns:
+            Sanitized copy of the data
+        """
+        if isinstance(data, str):
+            return self.redact_text(data)
+        
+        if isinstance(data, dict):
+            sanitized = {}
+            for key, value in data.items():
+                if isinstance(key, str):
+                    sensitive = key.lower() in self.SENSITIVE_KEY_NAMES
+                    key = self.redact_text(key)
+                    if sensitive and isinstance(value, str) and value:
+                        sanitized[key] = "[REDACTED]"
+                        continue
+                sanitized[key] = self._sanitize_value(value)
+            return sanitized
+        
+        if isinstance(data, (list, tuple)):
+            return [self._sanitize_value(item) for item in data]
+        
+        return data
 
 
 # Singleton instance
@@ -5,19 +5,86 @@ This module provides enhanced logging functionality for security-related events
 and audit trail maintenance.
 """
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import time
-import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None
+
 from .data_protection import get_data_protection
 
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> str:
+    """Serialize a log entry to JSON, stringifying unknown types."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=str, option=orjson.OPT_NON_STR_KEYS
+            ).decode("utf-8")
+        except TypeError:
+            # orjson rejects some values json accepts, such as integers
+            # wider than 64 bits
+            pass
+    return json.dumps(obj, default=str)
+
+
+# Whole second and its formatted local time, reused until the second changes;
+# kept as one tuple so concurrent callers never see a mismatched pair
+_second_prefix = (None, "")
+
+
+def _timestamp() -> str:
+    """Return the current local time in ISO 8601 format with microseconds."""
+    global _second_prefix
+    now_ns = time.time_ns()
+    second, micros = divmod(now_ns // 1000, 1_000_000)
+    cached_second, prefix = _second_prefix
+    if second != cached_second:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+        _second_prefix = (second, prefix)
+    return f"{prefix}.{micros:06d}"
+
+
+class _BatchingFileHandler(logging.FileHandler):
+    """
+    File handler that flushes once per batch of queued records.
+
+    Records fed by a QueueListener are written into the stream's buffer and
+    flushed only when the queue has been drained or max_batch records are
+    pending, turning a burst of events into a few large writes.
+    """
+
+    def __init__(self, filename: str, log_queue: queue.Queue, max_batch: int = 256):
+        super().__init__(filename)
+        self._queue = log_queue
+        self._max_batch = max_batch
+        self._pending = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+        self._pending += 1
+        if self._pending >= self._max_batch or self._queue.empty():
+            self.flush()
+            self._pending = 0
+
+
 class SecurityLogger:
     """
     Enhanced logger for security events with secure handling of sensitive data.
@@ -38,6 +105,14 @@ class SecurityLogger:
         "configuration_change": "CONFIG",
     }
 
+    # Logging levels for the supported event severities
+    _LEVELS = {
+        "INFO": logging.INFO,
+        "WARNING": logging.WARNING,
+        "ERROR": logging.ERROR,
+        "CRITICAL": logging.CRITICAL,
+    }
+
     def __init__(self, log_dir: Optional[str] = None):
         """
         Initialize the security logger.
@@ -47,6 +122,9 @@ class SecurityLogger:
         """
         self.log_dir = log_dir
         self.data_protection = get_data_protection()
+        self._sanitize_logs = self.data_protection.sanitize_logs
+        self._queue_handler: Optional[logging.Handler] = None
+        self._listener: Optional[logging.handlers.QueueListener] = None
 
         # Create a separate file handler for security events if log_dir is specified
         if log_dir and not os.path.exists(log_dir):
@@ -57,6 +135,9 @@ class SecurityLogger:
     def _setup_logger(self) -> None:
         """Set up the security logger with appropriate handlers."""
         self.security_logger = logging.getLogger("qwen_assistant.security")
+        # Bound once here; log_event calls these for every event
+        self._is_enabled_for = self.security_logger.isEnabledFor
+        self._log = self.security_logger.log
 
         # Set level to INFO to ensure all security events are logged
         self.security_logger.setLevel(logging.INFO)
@@ -66,14 +147,35 @@ class SecurityLogger:
             log_file = os.path.join(
                 self.log_dir, f"security_{datetime.now().strftime('%Y%m%d')}.log"
             )
+            log_queue: queue.Queue = queue.Queue(-1)
             try:
-                handler = logging.FileHandler(log_file)
+                handler = _BatchingFileHandler(log_file, log_queue)
             except FileNotFoundError:
                 # Directory might not actually exist in mocked environments
-                handler = logging.NullHandler()
+                self.security_logger.addHandler(logging.NullHandler())
+                return
             formatter = logging.Formatter("%(asctime)s [%(levelname)s] %(message)s")
             handler.setFormatter(formatter)
-            self.security_logger.addHandler(handler)
+
+            # Callers only enqueue records; a background listener thread does
+            # the blocking file writes, flushing once per drained batch
+            self._queue_handler = logging.handlers.QueueHandler(log_queue)
+            self._listener = logging.handlers.QueueListener(log_queue, handler)
+            self._listener.start()
+            self.security_logger.addHandler(self._queue_handler)
+            atexit.register(self.close)
+
+    def close(self) -> None:
+        """Flush queued security events to the log file and stop the writer."""
+        if self._listener is None:
+            return
+        atexit.unregister(self.close)
+        self.security_logger.removeHandler(self._queue_handler)
+        self._listener.stop()
+        for handler in self._listener.handlers:
+            handler.close()
+        self._listener = None
+        self._queue_handler = None
 
     def log_event(
         self,
@@ -91,16 +193,22 @@ class SecurityLogger:
             message: Brief description of the event
             details: Additional details about the event
             user_id: ID of the user related to the event
-            severity: Event severity (INFO, WARNING, ERROR, CRITICAL)
+            severity: Event severity, one of the uppercase names INFO, WARNING,
+                ERROR or CRITICAL; any other value is logged at INFO
         """
+        # Skip building the entry entirely when the level is filtered out
+        log_level = self._LEVELS.get(severity, logging.INFO)
+        if not self._is_enabled_for(log_level):
+            return
+
         event_code = self.EVENT_TYPES.get(event_type, "GENERAL")
 
-        # Create event ID for correlation
-        event_id = str(uuid.uuid4())
+        # Create an opaque random event ID for correlation
+        event_id = os.urandom(16).hex()
 
         # Create structured log entry
         log_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "event_id": event_id,
             "event_type": event_type,
             "event_code": event_code,
@@ -108,22 +216,15 @@ class SecurityLogger:
             "user_id": user_id,
         }
 
-        # Add details if provided, with sensitive data redacted
+        # Add details if provided, with sensitive data redacted; values that
+        # are not JSON serializable are logged as their string form
         if details:
-            sanitized_details = self.data_protection.sanitize_logs(details)
-            try:
-                json.dumps(sanitized_details)
-            except TypeError:
-                sanitized_details = json.loads(
-                    json.dumps(sanitized_details, default=str)
-                )
-            log_entry["details"] = sanitized_details
-
-        # Determine log level and log the event
-        log_level = getattr(logging, severity.upper())
-        log_message = json.dumps(log_entry)
-
-        self.security_logger.log(log_level, log_message)
+            log_entry["details"] = self._sanitize_logs(details)
+
+        # Log the event
+        log_message = _dumps(log_entry)
+
+        self._log(log_level, log_message)
 
     def log_auth_event(
         self,
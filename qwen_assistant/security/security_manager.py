@@ -120,7 +120,8 @@ class SecurityManager:
 
         # Log access to API key (masked)
         if key:
-            masked_key = self.api_key_manager.get_masked_key(key_name)
+            # Mask the key already in hand rather than looking it up again
+            masked_key = self.api_key_manager.mask_key(key)
             self.security_logger.log_access_event(
                 resource=f"api_key:{key_name}",
                 action="read",
@@ -37,6 +37,12 @@ class RequestValidator:
         r"sessionStorage",
     ]
 
+    # All patterns fused into one alternation, compiled once, so input is
+    # scanned a single time per check or substitution
+    _MALICIOUS_RE = re.compile(
+        "|".join(f"(?:{pattern})" for pattern in MALICIOUS_PATTERNS), re.IGNORECASE
+    )
+
     def __init__(self, max_message_length: int = 32000):
         """
         Initialize the request validator.
@@ -66,9 +72,8 @@ class RequestValidator:
             )
 
         # Check for potentially malicious content
-        for pattern in self.MALICIOUS_PATTERNS:
-            if re.search(pattern, message, re.IGNORECASE):
-                return False, "Message contains potentially harmful content"
+        if self._MALICIOUS_RE.search(message):
+            return False, "Message contains potentially harmful content"
 
         return True, None
 
@@ -95,14 +100,13 @@ class RequestValidator:
             return False, "Parameters must be a dictionary"
 
         # Convert any parameters to strings and check for malicious content
+        search = self._MALICIOUS_RE.search
         for key, value in parameters.items():
-            if isinstance(value, str):
-                for pattern in self.MALICIOUS_PATTERNS:
-                    if re.search(pattern, value, re.IGNORECASE):
-                        return (
-                            False,
-                            f"Parameter '{key}' contains potentially harmful content",
-                        )
+            if isinstance(value, str) and search(value):
+                return (
+                    False,
+                    f"Parameter '{key}' contains potentially harmful content",
+                )
 
         return True, None
 
@@ -119,22 +123,21 @@ class RequestValidator:
             Sanitized input data
         """
         if isinstance(data, str):
-            # Replace potentially harmful patterns in strings
-            sanitized = data
-            for pattern in self.MALICIOUS_PATTERNS:
-                sanitized = re.sub(pattern, "[REMOVED]", sanitized, flags=re.IGNORECASE)
-            return sanitized
+            # Replace potentially harmful patterns in strings; clean strings,
+            # the common case, are returned without substitution
+            if self._MALICIOUS_RE.search(data):
+                return self._MALICIOUS_RE.sub("[REMOVED]", data)
+            return data
         elif isinstance(data, dict):
             # Recursively sanitize dictionary values
-            sanitized = {}
-            for key, value in data.items():
-                if isinstance(value, (dict, list)):
-                    sanitized[key] = self.sanitize_input(value)
-                elif isinstance(value, str):
-                    sanitized[key] = self.sanitize_input(value)
-                else:
-                    sanitized[key] = value
-            return sanitized
+            return {
+                key: (
+                    self.sanitize_input(value)
+                    if isinstance(value, (str, dict, list))
+                    else value
+                )
+                for key, value in data.items()
+            }
         elif isinstance(data, list):
             # Recursively sanitize list items
             return [self.sanitize_input(item) for item in data]
@@ -153,6 +156,20 @@ class ResponseValidator:
     - Sensitive data filtering
     """
 
+    # Common patterns that might contain sensitive info in errors, compiled
+    # once with their replacements. They are applied one after another in
+    # this order: later patterns rescan the redacted text, so e.g. anything
+    # directly after a quoted value is redacted along with it.
+    _SENSITIVE_ERROR_PATTERNS = tuple(
+        (re.compile(pattern, re.IGNORECASE), replacement)
+        for pattern, replacement in (
+            (r"(password|secret|key|token)=\'[^\']+\'", r"\1=[REDACTED]"),
+            (r'(password|secret|key|token)="[^"]+"', r"\1=[REDACTED]"),
+            (r"(password|secret|key|token)=[^\s,)]+", r"\1=[REDACTED]"),
+            (r"ConnectionString=[^\s]*", "ConnectionString=[REDACTED]"),
+        )
+    )
+
     def __init__(self):
         """Initialize the response validator."""
         pass
@@ -196,30 +213,9 @@ class ResponseValidator:
         Returns:
             Sanitized error message
         """
-        # Common patterns that might contain sensitive info in errors
-        sensitive_patterns = [
-            r"(password|secret|key|token)=\'[^\']+\'",
-            r'(password|secret|key|token)="[^"]+"',
-            r"(password|secret|key|token)=[^\s,)]+",
-            r"ConnectionString=[^\s]*",
-        ]
-
         sanitized = error
-        for pattern in sensitive_patterns:
-            if "ConnectionString" in pattern:
-                sanitized = re.sub(
-                    pattern,
-                    "ConnectionString=[REDACTED]",
-                    sanitized,
-                    flags=re.IGNORECASE,
-                )
-            else:
-                sanitized = re.sub(
-                    pattern,
-                    r"\1=[REDACTED]",
-                    sanitized,
-                    flags=re.IGNORECASE,
-                )
+        for pattern, replacement in self._SENSITIVE_ERROR_PATTERNS:
+            sanitized = pattern.sub(replacement, sanitized)
 
         return sanitized
 
@@ -256,26 +252,68 @@ class ResponseValidator:
         """
         Remove internal fields that shouldn't be exposed to clients.
 
+        Data without internal fields, the common case, is returned as is
+        rather than copied.
+
         Args:
             data: Data to process
 
         Returns:
             Data with internal fields removed
         """
+        if not self._has_internal_fields(data):
+            return data
+        return self._strip_internal_fields(data)
+
+    @staticmethod
+    def _is_internal(key: str) -> bool:
+        """Return True for keys that start with _ or are named internal."""
+        return key.startswith("_") or key == "internal"
+
+    @classmethod
+    def _has_internal_fields(cls, data: Any) -> bool:
+        """
+        Check whether data contains any internal field at any depth.
+
+        Args:
+            data: Data to scan
+
+        Returns:
+            True if an internal field was found
+        """
+        stack = [data]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, dict):
+                for key, value in item.items():
+                    if cls._is_internal(key):
+                        return True
+                    stack.append(value)
+            elif isinstance(item, list):
+                stack.extend(item)
+        return False
+
+    def _strip_internal_fields(self, data: Any) -> Any:
+        """
+        Copy data without its internal fields.
+
+        Args:
+            data: Data to process
+
+        Returns:
+            Copy of data with internal fields removed
+        """
         if isinstance(data, dict):
-            # Create a new dict without internal fields
-            result = {}
-            for key, value in data.items():
-                # Skip keys that start with _ or internal
-                if key.startswith("_") or key == "internal":
-                    continue
-
-                # Recursively process nested structures
-                result[key] = self._remove_internal_fields(value)
-            return result
+            # Create a new dict without internal fields, recursively
+            # processing nested structures
+            return {
+                key: self._strip_internal_fields(value)
+                for key, value in data.items()
+                if not self._is_internal(key)
+            }
         elif isinstance(data, list):
             # Process each item in the list
-            return [self._remove_internal_fields(item) for item in data]
+            return [self._strip_internal_fields(item) for item in data]
         else:
             # Return primitive values as is
             return data
@@ -5,7 +5,7 @@ from typing import Optional
 import gradio as gr
 
 from .config import load_config
-from .agents.desktop import DesktopAgent
+from .agents.desktop import DesktopAgent, close_session
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +24,8 @@ class AssistantUI:
 
     async def cleanup(self):
         await self.agent.cleanup()
+        # Also close the shared HTTP sessions the chat handlers used
+        await close_session()
 
     async def _respond(self, message: str, history: list[tuple[str, str]]):
         request = {"query": message}
@@ -7,7 +7,11 @@ from typing import Dict, List, Optional, Set, Tuple, Union
 from loguru import logger
 from pydantic import BaseModel, Field
 
-from .credential_store import CredentialStore, DotenvCredentialStore
+from .credential_store import (
+    CredentialStore,
+    DotenvCredentialStore,
+    KeyringCredentialStore,
+)
 
 
 class AuthScope(str, Enum):
@@ -106,8 +110,6 @@ class AuthManager:
         
         # Set up credential store
         if self.config.use_keyring:
-            # Import here to avoid circular imports
-            from .credential_store import KeyringCredentialStore
             self.credential_store = KeyringCredentialStore(
                 service_name=self.config.service_name
             )
@@ -115,6 +117,32 @@ class AuthManager:
             self.credential_store = DotenvCredentialStore(
                 env_file=self.config.credentials_file
             )
+
+        # Cached values of all known credentials, rebuilt after any write
+        self._snapshot_version = 0
+        self._snapshot_cache: Optional[Tuple[int, Dict[str, Optional[str]]]] = None
+
+    def _snapshot(self) -> Dict[str, Optional[str]]:
+        """Get the values of all known credentials from a single store sweep.
+
+        The snapshot is cached and reused until a credential is set or
+        deleted through this manager, so status displays that query the
+        same credentials repeatedly only hit the store once.
+
+        Returns:
+            Dictionary mapping credential keys to their values (or None)
+        """
+        cached = self._snapshot_cache
+        if cached is not None and cached[0] == self._snapshot_version:
+            return cached[1]
+
+        snapshot = self.credential_store.get_credentials(self.CREDENTIAL_DEFINITIONS)
+        self._snapshot_cache = (self._snapshot_version, snapshot)
+        return snapshot
+
+    def _invalidate_snapshot(self) -> None:
+        """Invalidate the cached credential snapshot."""
+        self._snapshot_version += 1
     
     def get_credential(self, key: str) -> Optional[str]:
         """Get a credential by key.
@@ -135,6 +163,7 @@ class AuthManager:
             value: Credential value to store
         """
         self.credential_store.set_credential(key, value)
+        self._invalidate_snapshot()
     
     def delete_credential(self, key: str) -> None:
         """Delete a credential.
@@ -143,6 +172,7 @@ class AuthManager:
             key: Credential key to delete
         """
         self.credential_store.delete_credential(key)
+        self._invalidate_snapshot()
     
     def get_credentials_for_scope(self, scope: AuthScope) -> Dict[str, str]:
         """Get all credentials for a specific scope.
@@ -153,10 +183,11 @@ class AuthManager:
         Returns:
             Dictionary of credential keys and values for the scope
         """
+        snapshot = self._snapshot()
         result = {}
         for cred_key, cred_info in self.CREDENTIAL_DEFINITIONS.items():
             if cred_info.scope == scope:
-                value = self.get_credential(cred_key)
+                value = snapshot[cred_key]
                 if value:
                     result[cred_key] = value
         return result
@@ -172,6 +203,7 @@ class AuthManager:
         Returns:
             Tuple of (is_valid, missing_credentials)
         """
+        snapshot = self._snapshot()
         missing = []
         
         for cred_key, cred_info in self.CREDENTIAL_DEFINITIONS.items():
@@ -181,10 +213,10 @@ class AuthManager:
                 
             # Check required credentials
             if cred_info.required:
-                value = self.get_credential(cred_key)
+                value = snapshot[cred_key]
                 if not value:
                     missing.append(cred_key)
-                    logger.warning(f"Missing required credential: {cred_key}")
+                    logger.warning("Missing required credential: {}", cred_key)
         
         return len(missing) == 0, missing
     
@@ -194,11 +226,12 @@ class AuthManager:
         Returns:
             Dictionary mapping scopes to lists of missing credential keys
         """
+        snapshot = self._snapshot()
         result: Dict[AuthScope, List[str]] = {}
         
         for cred_key, cred_info in self.CREDENTIAL_DEFINITIONS.items():
             if cred_info.required:
-                value = self.get_credential(cred_key)
+                value = snapshot[cred_key]
                 if not value:
                     scope = cred_info.scope
                     if scope not in result:
@@ -213,10 +246,11 @@ class AuthManager:
         Returns:
             Dictionary mapping credential keys to metadata
         """
+        snapshot = self._snapshot()
         result = {}
         
         for cred_key, cred_info in self.CREDENTIAL_DEFINITIONS.items():
-            value = self.get_credential(cred_key)
+            value = snapshot[cred_key]
             result[cred_key] = {
                 "description": cred_info.description,
                 "scope": cred_info.scope,
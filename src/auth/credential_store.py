@@ -1,9 +1,11 @@
 """Credential storage for Qwen Multi-Assistant."""
 
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Union
+from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import keyring
 from dotenv import load_dotenv
@@ -25,6 +27,20 @@ class CredentialStore(ABC):
         """
         pass
 
+    def get_credentials(self, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Get several credential values at once.
+        
+        Stores that can read many credentials in one operation should
+        override this; the default falls back to one lookup per key.
+        
+        Args:
+            keys: The credential keys to retrieve
+            
+        Returns:
+            Dictionary mapping each key to its value or None if not found
+        """
+        return {key: self.get_credential(key) for key in keys}
+
     @abstractmethod
     def set_credential(self, key: str, value: str) -> None:
         """Store a credential value.
@@ -78,6 +94,18 @@ class DotenvCredentialStore(CredentialStore):
         """
         return os.environ.get(key)
     
+    def get_credentials(self, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Get several credentials from environment variables in one pass.
+        
+        Args:
+            keys: The credential keys to retrieve
+            
+        Returns:
+            Dictionary mapping each key to its value or None if not found
+        """
+        environ = os.environ
+        return {key: environ.get(key) for key in keys}
+    
     def set_credential(self, key: str, value: str) -> None:
         """Set a credential in the .env file.
         
@@ -161,14 +189,30 @@ class DotenvCredentialStore(CredentialStore):
 class KeyringCredentialStore(CredentialStore):
     """Credential storage using the system keyring service."""
 
-    def __init__(self, service_name: str = "qwen_assistant"):
+    def __init__(
+        self,
+        service_name: str = "qwen_assistant",
+        cache_ttl: float = 60.0,
+        cache_size: int = 512,
+    ):
         """Initialize the keyring credential store.
         
+        Reads are cached in memory for ``cache_ttl`` seconds, since every
+        keyring lookup is an IPC round-trip to the OS keychain. Writes and
+        deletes through this store invalidate the cached entry.
+        
         Args:
             service_name: Name of the service in the keyring
+            cache_ttl: Seconds a value read from the keyring stays cached
+                (0 disables caching)
+            cache_size: Maximum number of cached credentials
         """
         self.service_name = service_name
         self._credential_keys: Set[str] = set()
+        self._cache_ttl = cache_ttl
+        self._cache_size = cache_size
+        self._cache: Dict[str, Tuple[float, Optional[str]]] = {}
+        self._cache_lock = threading.Lock()
     
     def get_credential(self, key: str) -> Optional[str]:
         """Get a credential from the keyring.
@@ -179,11 +223,33 @@ class KeyringCredentialStore(CredentialStore):
         Returns:
             The credential value or None if not found
         """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
         try:
-            return keyring.get_password(self.service_name, key)
+            value = keyring.get_password(self.service_name, key)
         except Exception as e:
-            logger.error(f"Failed to retrieve credential {key} from keyring: {e}")
+            logger.error("Failed to retrieve credential {} from keyring: {}", key, e)
             return None
+
+        if self._cache_ttl > 0:
+            with self._cache_lock:
+                if key not in self._cache and len(self._cache) >= self._cache_size:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    del self._cache[next(iter(self._cache))]
+                self._cache[key] = (time.monotonic() + self._cache_ttl, value)
+        return value
+    
+    def _invalidate(self, key: str) -> None:
+        """Drop a cached credential value.
+        
+        Args:
+            key: The credential key to drop from the cache
+        """
+        with self._cache_lock:
+            self._cache.pop(key, None)
     
     def set_credential(self, key: str, value: str) -> None:
         """Store a credential in the keyring.
@@ -194,9 +260,10 @@ class KeyringCredentialStore(CredentialStore):
         """
         try:
             keyring.set_password(self.service_name, key, value)
+            self._invalidate(key)
             self._credential_keys.add(key)
         except Exception as e:
-            logger.error(f"Failed to store credential {key} in keyring: {e}")
+            logger.error("Failed to store credential {} in keyring: {}", key, e)
     
     def delete_credential(self, key: str) -> None:
         """Delete a credential from the keyring.
@@ -206,10 +273,11 @@ class KeyringCredentialStore(CredentialStore):
         """
         try:
             keyring.delete_password(self.service_name, key)
+            self._invalidate(key)
             if key in self._credential_keys:
                 self._credential_keys.remove(key)
         except Exception as e:
-            logger.error(f"Failed to delete credential {key} from keyring: {e}")
+            logger.error("Failed to delete credential {} from keyring: {}", key, e)
     
     def list_credentials(self) -> List[str]:
         """List all available credential keys in the keyring.
@@ -242,6 +310,18 @@ class MemoryCredentialStore(CredentialStore):
         """
         return self._credentials.get(key)
     
+    def get_credentials(self, keys: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Get several credentials from memory in one pass.
+        
+        Args:
+            keys: The credential keys to retrieve
+            
+        Returns:
+            Dictionary mapping each key to its value or None if not found
+        """
+        credentials = self._credentials
+        return {key: credentials.get(key) for key in keys}
+    
     def set_credential(self, key: str, value: str) -> None:
         """Store a credential in memory.
         
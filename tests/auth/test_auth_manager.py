@@ -0,0 +1,68 @@
+"""
+Tests for the authentication manager.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+from src.auth import AuthManager, AuthScope, MemoryCredentialStore
+
+
+@pytest.fixture
+def auth_manager(tmp_path):
+    """Create an auth manager backed by a spied in-memory store."""
+    manager = AuthManager({"credentials_file": str(tmp_path / ".env")})
+    store = MemoryCredentialStore()
+    store.set_credential("OPENROUTER_API_KEY", "sk-or-test")
+    store.set_credential("EXA_API_KEY", "exa-test")
+    manager.credential_store = MagicMock(wraps=store)
+    return manager
+
+
+class TestAuthManager:
+    """Test suite for AuthManager."""
+
+    def test_credential_info(self, auth_manager):
+        """Test credential info reports which credentials are set."""
+        info = auth_manager.get_credential_info()
+
+        assert info["OPENROUTER_API_KEY"]["is_set"] is True
+        assert info["AIRTABLE_API_KEY"]["is_set"] is False
+        assert info["EXA_API_KEY"]["scope"] == AuthScope.EXA
+
+    def test_snapshot_reused_across_queries(self, auth_manager):
+        """Test repeated status queries sweep the store only once."""
+        auth_manager.get_credential_info()
+        for scope in AuthScope:
+            auth_manager.get_credentials_for_scope(scope)
+
+        store = auth_manager.credential_store
+        store.get_credentials.assert_called_once()
+        store.get_credential.assert_not_called()
+
+    def test_validate_credentials(self, auth_manager):
+        """Test validation reports missing required credentials from one sweep."""
+        is_valid, missing = auth_manager.validate_credentials()
+        assert is_valid is False
+        assert missing == ["AIRTABLE_API_KEY"]
+
+        is_valid, missing = auth_manager.validate_credentials(AuthScope.LLM)
+        assert is_valid is True
+        assert missing == []
+
+        assert auth_manager.get_missing_credentials() == {
+            AuthScope.AIRTABLE: ["AIRTABLE_API_KEY"]
+        }
+        auth_manager.credential_store.get_credentials.assert_called_once()
+
+    def test_snapshot_invalidated_on_write(self, auth_manager):
+        """Test setting and deleting credentials refreshes the snapshot."""
+        assert auth_manager.get_credentials_for_scope(AuthScope.AIRTABLE) == {}
+
+        auth_manager.set_credential("AIRTABLE_API_KEY", "pat-test")
+        assert auth_manager.get_credentials_for_scope(AuthScope.AIRTABLE) == {
+            "AIRTABLE_API_KEY": "pat-test"
+        }
+
+        auth_manager.delete_credential("AIRTABLE_API_KEY")
+        assert auth_manager.get_credential_info()["AIRTABLE_API_KEY"]["is_set"] is False
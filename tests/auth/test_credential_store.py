@@ -0,0 +1,85 @@
+"""
+Tests for the credential stores.
+"""
+
+import pytest
+from unittest.mock import patch
+
+from src.auth import DotenvCredentialStore, KeyringCredentialStore
+
+
+@pytest.fixture
+def fake_keyring():
+    """Patch the keyring backend with an in-memory dictionary."""
+    passwords = {}
+    with patch("src.auth.credential_store.keyring") as mock_keyring:
+        mock_keyring.get_password.side_effect = lambda service, key: passwords.get(
+            (service, key)
+        )
+        mock_keyring.set_password.side_effect = (
+            lambda service, key, value: passwords.__setitem__((service, key), value)
+        )
+        mock_keyring.delete_password.side_effect = lambda service, key: passwords.pop(
+            (service, key)
+        )
+        yield mock_keyring
+
+
+class TestKeyringCredentialStore:
+    """Test suite for KeyringCredentialStore."""
+
+    def test_reads_are_cached(self, fake_keyring):
+        """Test repeated reads only hit the keyring once."""
+        store = KeyringCredentialStore(service_name="qwen_test")
+        store.set_credential("KEY", "value")
+
+        assert store.get_credential("KEY") == "value"
+        assert store.get_credential("KEY") == "value"
+        assert fake_keyring.get_password.call_count == 1
+
+    def test_writes_invalidate_cache(self, fake_keyring):
+        """Test set and delete drop the cached value."""
+        store = KeyringCredentialStore(service_name="qwen_test")
+        store.set_credential("KEY", "old")
+        assert store.get_credential("KEY") == "old"
+
+        store.set_credential("KEY", "new")
+        assert store.get_credential("KEY") == "new"
+
+        store.delete_credential("KEY")
+        assert store.get_credential("KEY") is None
+
+    def test_cache_expiry(self, fake_keyring):
+        """Test cached values are re-read once the TTL has passed."""
+        store = KeyringCredentialStore(service_name="qwen_test", cache_ttl=10)
+        store.set_credential("KEY", "value")
+
+        with patch("src.auth.credential_store.time.monotonic", return_value=0):
+            store.get_credential("KEY")
+        with patch("src.auth.credential_store.time.monotonic", return_value=5):
+            store.get_credential("KEY")
+        assert fake_keyring.get_password.call_count == 1
+
+        with patch("src.auth.credential_store.time.monotonic", return_value=11):
+            store.get_credential("KEY")
+        assert fake_keyring.get_password.call_count == 2
+
+    def test_cache_size_is_bounded(self, fake_keyring):
+        """Test the cache evicts its oldest entry when full."""
+        store = KeyringCredentialStore(service_name="qwen_test", cache_size=2)
+        for key in ("A", "B", "C"):
+            store.get_credential(key)
+
+        assert list(store._cache) == ["B", "C"]
+
+
+def test_dotenv_get_credentials(tmp_path, monkeypatch):
+    """Test bulk reads from the dotenv store."""
+    monkeypatch.setenv("QWEN_TEST_PRESENT", "value")
+    monkeypatch.delenv("QWEN_TEST_MISSING", raising=False)
+    store = DotenvCredentialStore(env_file=tmp_path / ".env")
+
+    assert store.get_credentials(["QWEN_TEST_PRESENT", "QWEN_TEST_MISSING"]) == {
+        "QWEN_TEST_PRESENT": "value",
+        "QWEN_TEST_MISSING": None,
+    }
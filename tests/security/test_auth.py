@@ -60,6 +60,41 @@ class TestAuth:
         assert is_valid is False
         assert session is None
     
+    def test_validate_token_after_issue_second(self):
+        """Test tokens stay valid after the second they were issued in."""
+        auth = Auth("test_secret_key")
+        session = auth.create_session("test_user")
+        
+        with patch("time.time", return_value=time.time() + 5):
+            is_valid, validated = auth.validate_token(session["access_token"])
+        
+        assert is_valid is True
+        assert validated["session_id"] == session["session_id"]
+    
+    def test_validate_token_rejects_other_user(self):
+        """Test a correctly signed payload for another user is rejected."""
+        auth = Auth("test_secret_key")
+        session = auth.create_session("test_user")
+        session_id = session["session_id"]
+        payload = "other_user:123"
+        token = f"{session_id}.{payload}.{auth._sign(session_id, payload)}"
+        
+        is_valid, validated = auth.validate_token(token)
+        
+        assert is_valid is False
+        assert validated is None
+    
+    def test_long_secret_key(self):
+        """Test secrets longer than the BLAKE2b key size still sign tokens."""
+        auth = Auth("k" * 200)
+        session = auth.create_session("test_user")
+        assert auth.validate_token(session["access_token"])[0] is True
+        
+        # The whole secret counts, not just the first 64 bytes
+        other = Auth("k" * 64 + "x" * 136)
+        other._sessions = auth._sessions
+        assert other.validate_token(session["access_token"])[0] is False
+    
     def test_invalidate_session(self):
         """Test invalidating a session."""
         auth = Auth("test_secret_key")
@@ -93,6 +128,65 @@ class TestAuth:
         # Verify token is invalid due to expiration
         is_valid, _ = auth.validate_token(session["access_token"])
         assert is_valid is False
+        assert session_id not in auth._sessions
+    
+    def test_session_limit(self):
+        """Test the number of stored sessions is bounded."""
+        auth = Auth("test_secret_key", max_sessions=3)
+        expired = auth.create_session("expired_user")
+        auth._sessions[expired["session_id"]]["expires_at"] = int(time.time()) - 1
+        sessions = [auth.create_session(f"user{i}") for i in range(3)]
+        
+        # The expired session made room for the third one
+        assert len(auth._sessions) == 3
+        assert expired["session_id"] not in auth._sessions
+        
+        # Once full, the oldest session is evicted
+        newest = auth.create_session("newest_user")
+        assert len(auth._sessions) == 3
+        assert sessions[0]["session_id"] not in auth._sessions
+        assert auth.validate_token(newest["access_token"])[0] is True
+        assert auth.validate_token(sessions[0]["access_token"])[0] is False
+    
+    def test_session_limit_evicts_least_recently_used(self):
+        """Test validating a session keeps it from being evicted first."""
+        auth = Auth("test_secret_key", max_sessions=3)
+        sessions = [auth.create_session(f"user{i}") for i in range(3)]
+        assert auth.validate_token(sessions[0]["access_token"])[0] is True
+        
+        auth.create_session("newest_user")
+        
+        assert sessions[0]["session_id"] in auth._sessions
+        assert sessions[1]["session_id"] not in auth._sessions
+    
+    def test_session_limit_of_one(self):
+        """Test the smallest store keeps just the newest session."""
+        auth = Auth("test_secret_key", max_sessions=1)
+        auth.create_session("first_user")
+        newest = auth.create_session("second_user")
+        
+        assert list(auth._sessions) == [newest["session_id"]]
+    
+    @pytest.mark.parametrize("max_sessions", [0, -1])
+    def test_invalid_session_limit(self, max_sessions):
+        """Test a session limit below one is rejected."""
+        with pytest.raises(ValueError):
+            Auth("test_secret_key", max_sessions=max_sessions)
+    
+    def test_session_limit_evicts_in_batches(self):
+        """Test a full store is pruned to 90% so the sweep is not run per call."""
+        auth = Auth("test_secret_key", max_sessions=100)
+        for i in range(100):
+            auth.create_session(f"user{i}")
+        
+        auth.create_session("user100")
+        assert len(auth._sessions) == 91
+        
+        with patch.object(auth, "_prune_sessions", wraps=auth._prune_sessions) as prune:
+            for i in range(9):
+                auth.create_session(f"later{i}")
+            prune.assert_not_called()
+        assert len(auth._sessions) == 100
 
 
 def test_get_auth_singleton():
@@ -57,6 +57,54 @@ class TestDataProtection:
         assert dp.redact_text("") == ""
         assert dp.redact_text(None) is None
     
+    def test_clean_request_data_copies_on_write(self):
+        """Test cleaning only copies containers that hold redacted values."""
+        dp = DataProtection()
+        settings = {"theme": "dark"}
+        history = [{"role": "user", "content": "hi"}]
+        data = {
+            "settings": settings,
+            "history": history,
+            "auth": [{"Token": "abc"}],
+        }
+        
+        cleaned = dp.clean_request_data(data)
+        
+        assert cleaned["auth"] == [{"Token": "[REDACTED]"}]
+        assert data["auth"] == [{"Token": "abc"}]
+        assert cleaned["settings"] is settings
+        assert cleaned["history"] is history
+        
+        # Nothing sensitive: the original is returned untouched
+        clean = {"settings": settings, "history": history}
+        assert dp.clean_request_data(clean) is clean
+    
+    def test_redact_text_all_kinds(self):
+        """Test every kind of sensitive data in one text is redacted."""
+        dp = DataProtection()
+        text = (
+            "card 1234-5678-9012-3456, ssn 123-45-6789, key sk-1234567890abcdefghijklmn, "
+            "mail user@example.com, phone (123) 456-7890"
+        )
+        
+        redacted = dp.redact_text(text)
+        
+        assert redacted == (
+            "card [REDACTED-CREDIT_CARD], ssn [REDACTED-SSN], key [REDACTED-API_KEY], "
+            "mail [REDACTED-EMAIL], phone ([REDACTED-PHONE]"
+        )
+    
+    def test_redact_text_keys_take_priority_over_email(self):
+        """Test an API key touching an email is not left partly visible."""
+        dp = DataProtection()
+        
+        assert dp.redact_text("user@example.com8.token=bbbbbbbbbbbbbbbbbbbb") == (
+            "user@example.com8.[REDACTED-API_KEY]"
+        )
+        assert dp.redact_text("x@example.com3.sk-aaaaaaaaaaaaaaaaaaaaaaaa") == (
+            "x@example.com3.[REDACTED-API_KEY]"
+        )
+    
     def test_clean_request_data(self):
         """Test cleaning a request data dictionary."""
         dp = DataProtection()
@@ -134,6 +182,31 @@ class TestDataProtection:
         assert "user@example.com" not in json.dumps(sanitized)
         assert "1234-5678-9012-3456" not in json.dumps(sanitized)
         
+        # Test values are sanitized in place of a JSON round trip
+        log_dict = {
+            "password": "hunter2",
+            "count": 1234567890123456,
+            "items": ("call (123) 456-7890", None),
+        }
+        sanitized = dp.sanitize_logs(log_dict)
+        assert sanitized == {
+            "password": "[REDACTED]",
+            "count": 1234567890123456,
+            "items": ["call ([REDACTED-PHONE]", None],
+        }
+        assert log_dict["password"] == "hunter2"
+        
+        # Test keys touching an email are fully redacted at any depth
+        log_dict = {
+            "event": {"note": "user@example.com8.token=bbbbbbbbbbbbbbbbbbbb"},
+            "items": [["x@example.com3.sk-aaaaaaaaaaaaaaaaaaaaaaaa"]],
+        }
+        sanitized = dp.sanitize_logs(log_dict)
+        assert sanitized == {
+            "event": {"note": "user@example.com8.[REDACTED-API_KEY]"},
+            "items": [["x@example.com3.[REDACTED-API_KEY]"]],
+        }
+        
         # Test non-string/dict data is returned as is
         assert dp.sanitize_logs(123) == 123
         assert dp.sanitize_logs(True) is True
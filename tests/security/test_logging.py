@@ -4,11 +4,20 @@ Tests for the security logging module.
 
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import pytest
 from unittest.mock import patch, MagicMock, ANY
 
-from qwen_assistant.security.logging import SecurityLogger, get_security_logger
+from datetime import datetime
+
+from qwen_assistant.security.logging import (
+    SecurityLogger,
+    _BatchingFileHandler,
+    _timestamp,
+    get_security_logger,
+)
 
 
 class TestSecurityLogger:
@@ -36,6 +45,31 @@ class TestSecurityLogger:
             mock_makedirs.assert_called_once_with("/test/logs", exist_ok=True)
             assert logger.log_dir == "/test/logs"
     
+    def test_log_dir_writes_through_background_listener(self, tmp_path):
+        """Test events are written to the log file by the queue listener."""
+        logger = SecurityLogger(log_dir=str(tmp_path))
+        try:
+            assert isinstance(logger._queue_handler, logging.handlers.QueueHandler)
+            logger.log_event(
+                event_type="authentication",
+                message="User logged in",
+                user_id="test_user"
+            )
+        finally:
+            # Stopping the listener drains the queue into the file
+            logger.close()
+        
+        assert logger._listener is None
+        assert logger._queue_handler not in logger.security_logger.handlers
+        
+        (log_file,) = tmp_path.iterdir()
+        line = log_file.read_text().strip()
+        assert "[INFO]" in line
+        assert json.loads(line.split("] ", 1)[1])["user_id"] == "test_user"
+        
+        # Closing again is a no-op
+        logger.close()
+    
     @patch('qwen_assistant.security.logging.get_data_protection')
     @patch('logging.Logger.log')
     def test_log_event(self, mock_log, mock_get_data_protection):
@@ -72,12 +106,71 @@ class TestSecurityLogger:
         assert log_data["message"] == "User logged in"
         assert log_data["user_id"] == "test_user"
         assert "timestamp" in log_data
-        assert "event_id" in log_data
+        assert len(log_data["event_id"]) == 32
+        int(log_data["event_id"], 16)
         assert "details" in log_data
         
         # Verify data sanitization was used
         mock_data_protection.sanitize_logs.assert_called_once_with({"ip": "192.168.1.1"})
     
+    @patch('qwen_assistant.security.logging.get_data_protection')
+    @patch('logging.Logger.log')
+    def test_log_event_skips_disabled_levels(self, mock_log, mock_get_data_protection):
+        """Test no entry is built when the severity is filtered out."""
+        mock_data_protection = MagicMock()
+        mock_get_data_protection.return_value = mock_data_protection
+        
+        logger = SecurityLogger()
+        logger.security_logger.setLevel(logging.ERROR)
+        
+        logger.log_event(
+            event_type="authentication",
+            message="User logged in",
+            details={"ip": "192.168.1.1"},
+            severity="WARNING"
+        )
+        
+        mock_log.assert_not_called()
+        mock_data_protection.sanitize_logs.assert_not_called()
+    
+    @patch('logging.Logger.log')
+    def test_log_event_logs_int_keys_and_big_ints(self, mock_log):
+        """Test details with non-str keys and very large integers are logged."""
+        logger = SecurityLogger()
+        logger.log_event(
+            event_type="data_access",
+            message="Resource read",
+            details={1: "x", "n": 2**70},
+        )
+        
+        log_data = json.loads(mock_log.call_args[0][1])
+        assert log_data["details"] == {"1": "x", "n": 2**70}
+    
+    @patch('logging.Logger.log')
+    def test_log_event_unknown_severity_logs_at_info(self, mock_log):
+        """Test severities outside the canonical names fall back to INFO."""
+        logger = SecurityLogger()
+        logger.log_event(event_type="authentication", message="x", severity="notice")
+        
+        assert mock_log.call_args[0][0] == logging.INFO
+    
+    @patch('logging.Logger.log')
+    def test_log_event_stringifies_unserializable_details(self, mock_log):
+        """Test details that JSON cannot encode are logged as strings."""
+        class Resource:
+            def __str__(self):
+                return "resource:42"
+        
+        logger = SecurityLogger()
+        logger.log_event(
+            event_type="data_access",
+            message="Resource read",
+            details={"resource": Resource(), "count": 3},
+        )
+        
+        log_data = json.loads(mock_log.call_args[0][1])
+        assert log_data["details"] == {"resource": "resource:42", "count": 3}
+    
     @patch('qwen_assistant.security.logging.get_data_protection')
     def test_log_auth_event(self, mock_get_data_protection):
         """Test logging an authentication event."""
@@ -316,6 +409,46 @@ class TestSecurityLogger:
         )
 
 
+def test_batching_file_handler_flushes_per_batch(tmp_path):
+    """Test records are flushed when the queue drains or the batch fills."""
+    log_queue = queue.Queue()
+    handler = _BatchingFileHandler(str(tmp_path / "security.log"), log_queue, max_batch=3)
+    record = logging.makeLogRecord({"msg": "event"})
+    try:
+        with patch.object(handler, "flush") as mock_flush:
+            # More records are queued behind this one: keep buffering
+            log_queue.put("pending")
+            handler.emit(record)
+            handler.emit(record)
+            mock_flush.assert_not_called()
+            
+            # The batch is full
+            handler.emit(record)
+            mock_flush.assert_called_once()
+            
+            # The queue has drained
+            log_queue.get()
+            handler.emit(record)
+            assert mock_flush.call_count == 2
+    finally:
+        handler.close()
+    
+    assert (tmp_path / "security.log").read_text() == "event\n" * 4
+
+
+def test_timestamp_matches_local_isoformat():
+    """Test the cached timestamp is a local ISO 8601 time with microseconds."""
+    before = datetime.now()
+    first = _timestamp()
+    second = _timestamp()
+    after = datetime.now()
+    
+    for stamp in (first, second):
+        assert len(stamp) == len("2024-01-01T00:00:00.000000")
+        assert before.replace(microsecond=0) <= datetime.fromisoformat(stamp) <= after
+    assert first <= second
+
+
 @patch('qwen_assistant.security.logging.SecurityLogger')
 def test_get_security_logger_singleton(mock_security_logger):
     """Test that get_security_logger returns a singleton instance."""
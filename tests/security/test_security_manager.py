@@ -107,7 +107,7 @@ class TestSecurityManager:
         mock_get_api_key_manager.return_value = mock_api_key_manager
         
         mock_api_key_manager.get_key.return_value = "test_api_key"
-        mock_api_key_manager.get_masked_key.return_value = "test...key"
+        mock_api_key_manager.mask_key.return_value = "test...key"
         
         # Create security manager with mocked components
         with patch('qwen_assistant.security.auth.get_auth'),\
@@ -128,8 +128,14 @@ class TestSecurityManager:
             # Verify key is returned
             assert key == "test_api_key"
             
+            # Verify the fetched key was masked without a second lookup
+            mock_api_key_manager.mask_key.assert_called_once_with("test_api_key")
+            mock_api_key_manager.get_masked_key.assert_not_called()
+            
             # Verify logging of access
             security_manager.security_logger.log_access_event.assert_called_once()
+            details = security_manager.security_logger.log_access_event.call_args.kwargs["details"]
+            assert details == {"masked_key": "test...key"}
     
     @patch('qwen_assistant.security.security_manager.get_auth')
     def test_create_session(self, mock_get_auth):
@@ -256,6 +262,41 @@ class TestSecurityManager:
             # Verify security violation was logged
             security_manager.security_logger.log_security_violation.assert_called_once()
 
+    
+    def test_replaced_components_are_used(self):
+        """Test hot paths call components assigned after construction."""
+        security_manager = SecurityManager()
+        
+        new_validator = MagicMock()
+        new_validator.validate_tool_parameters.return_value = (True, None)
+        new_protection = MagicMock()
+        new_protection.clean_request_data.return_value = {"q": "clean"}
+        security_manager.request_validator = new_validator
+        security_manager.data_protection = new_protection
+        security_manager.security_logger = MagicMock()
+        
+        assert security_manager.request_validator is new_validator
+        is_valid, error = security_manager.validate_tool_call("search", {"q": "raw"})
+        
+        assert (is_valid, error) == (True, None)
+        new_validator.validate_tool_parameters.assert_called_once_with("search", {"q": "raw"})
+        new_protection.clean_request_data.assert_called_once_with({"q": "raw"})
+        security_manager.security_logger.log_tool_usage.assert_called_once()
+    
+    def test_patched_component_methods_are_used(self):
+        """Test methods patched on a live component take effect."""
+        security_manager = SecurityManager()
+        security_manager.security_logger = MagicMock()
+        
+        with patch.object(
+            security_manager.request_validator,
+            "validate_user_message",
+            return_value=(False, "patched"),
+        ):
+            is_valid, error = security_manager.validate_user_message("Hello world")
+        
+        assert (is_valid, error) == (False, "patched")
+        security_manager.security_logger.log_security_violation.assert_called_once()
 
 @patch('qwen_assistant.security.security_manager.SecurityManager')
 def test_get_security_manager_singleton(mock_security_manager):
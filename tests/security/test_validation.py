@@ -117,6 +117,11 @@ class TestRequestValidator:
         assert validator.sanitize_input(123) == 123
         assert validator.sanitize_input(True) is True
         assert validator.sanitize_input(None) is None
+        
+        # Clean strings come back unchanged and a dict keeps its keys and values
+        clean_str = "just some text"
+        assert validator.sanitize_input(clean_str) is clean_str
+        assert validator.sanitize_input({"a": clean_str, "b": 1}) == {"a": clean_str, "b": 1}
 
 
 class TestResponseValidator:
@@ -181,6 +186,21 @@ class TestResponseValidator:
         sanitized = validator.sanitize_error_messages(error_with_conn)
         assert "Password=mypass" not in sanitized
         assert "ConnectionString=[REDACTED]" in sanitized
+        
+        # Several kinds of sensitive values in one message
+        error_mixed = "token=abc123, secret='s3cr3t' ConnectionString=Server=x;"
+        sanitized = validator.sanitize_error_messages(error_mixed)
+        assert sanitized == "token=[REDACTED], secret=[REDACTED] ConnectionString=[REDACTED]"
+        
+        # Text directly after a quoted value is redacted with it
+        sanitized = validator.sanitize_error_messages("Bad password='x'abc here")
+        assert sanitized == "Bad password=[REDACTED] here"
+        
+        # A stray quote inside a value doesn't swallow the text after it
+        sanitized = validator.sanitize_error_messages('token=bb"; aa"')
+        assert sanitized == 'token=[REDACTED] aa"'
+        sanitized = validator.sanitize_error_messages("ConnectionString=a'b c'")
+        assert sanitized == "ConnectionString=[REDACTED] c'"
     
     def test_prepare_safe_response(self):
         """Test preparing safe responses."""
@@ -261,6 +281,10 @@ class TestResponseValidator:
         assert validator._remove_internal_fields(123) == 123
         assert validator._remove_internal_fields("string") == "string"
         assert validator._remove_internal_fields(True) is True
+        
+        # Data without internal fields is returned without copying
+        clean = {"public": "visible", "nested": [{"items": [1, 2]}]}
+        assert validator._remove_internal_fields(clean) is clean
 
 
 def test_get_request_validator_singleton():
@@ -0,0 +1,143 @@
+"""
+Tests for configuration loading.
+"""
+import os
+
+import pytest
+from unittest.mock import patch
+
+from qwen_assistant import config as config_module
+from qwen_assistant.config import load_config
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a small configuration file."""
+    path = tmp_path / "config.yaml"
+    path.write_text("extra:\n  value: 1\n")
+    config_module._load_file_config.cache_clear()
+    return path
+
+
+def test_deep_update_merges_nested_dicts():
+    """Test nested dicts are merged while other values are replaced."""
+    target = {"a": {"b": {"c": 1, "d": 2}, "e": [1]}, "f": 1}
+    source = {"a": {"b": {"c": 10}, "e": [2]}, "f": {"g": 1}, "h": None}
+
+    result = config_module._deep_update(target, source)
+
+    assert result is target
+    assert target == {"a": {"b": {"c": 10, "d": 2}, "e": [2]}, "f": {"g": 1}, "h": None}
+
+
+class TestLoadConfig:
+    """Test suite for load_config."""
+
+    def test_defaults(self):
+        """Test loading without a config file returns the defaults."""
+        config = load_config()
+        assert config["ui"]["port"] == 7860
+        assert config["models"]["router"]["model"] == "qwen3-235b"
+
+    def test_file_values_are_merged(self, config_file):
+        """Test values from the config file are merged into the defaults."""
+        config = load_config(str(config_file))
+        assert config["extra"] == {"value": 1}
+        assert "models" in config
+
+    def test_file_is_parsed_once(self, config_file):
+        """Test repeated loads of an unchanged file reuse the parsed result."""
+        with patch.object(
+            config_module.yaml, "load", wraps=config_module.yaml.load
+        ) as mock_load:
+            load_config(str(config_file))
+            load_config(str(config_file))
+
+        assert mock_load.call_count == 1
+
+    def test_file_changes_are_picked_up(self, config_file):
+        """Test editing the config file invalidates the cached parse."""
+        load_config(str(config_file))
+
+        config_file.write_text("extra:\n  value: 2\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        assert load_config(str(config_file))["extra"] == {"value": 2}
+
+    def test_env_overrides_apply_to_cached_config(self, config_file, monkeypatch):
+        """Test environment overrides are applied on every load."""
+        load_config(str(config_file))
+
+        monkeypatch.setenv("QWEN_UI_PORT", "9999")
+        assert load_config(str(config_file))["ui"]["port"] == 9999
+
+        monkeypatch.delenv("QWEN_UI_PORT")
+        assert load_config(str(config_file))["ui"]["port"] == 7860
+
+    def test_invalid_port_is_ignored(self, monkeypatch):
+        """Test a non-numeric port override keeps the configured port."""
+        monkeypatch.setenv("QWEN_UI_PORT", "not-a-port")
+        monkeypatch.setenv("QWEN_UI_TITLE", "From env")
+
+        config = load_config()
+
+        assert config["ui"]["port"] == 7860
+        assert config["ui"]["title"] == "From env"
+
+    def test_defaults_are_not_modified(self, tmp_path, monkeypatch):
+        """Test merging a file and env overrides leaves DEFAULT_CONFIG intact."""
+        path = tmp_path / "config.yaml"
+        path.write_text("ui:\n  title: Custom\n")
+        monkeypatch.setenv("QWEN_MODEL_ROUTER", "custom-model")
+
+        config = load_config(str(path))
+
+        assert config["ui"]["title"] == "Custom"
+        assert config["models"]["router"]["model"] == "custom-model"
+        assert config_module.DEFAULT_CONFIG["ui"]["title"] == "Qwen Multi-Assistant"
+        assert config_module.DEFAULT_CONFIG["models"]["router"]["model"] == "qwen3-235b"
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_file(self, tmp_path, monkeypatch, use_orjson):
+        """Test .json config files are parsed as JSON."""
+        if not use_orjson:
+            monkeypatch.setattr(config_module, "orjson", None)
+        path = tmp_path / "config.json"
+        path.write_text('{"ui": {"title": "From JSON"}}')
+
+        config = load_config(str(path))
+
+        assert config["ui"]["title"] == "From JSON"
+        assert config["ui"]["port"] == 7860
+
+    def test_file_is_loaded_safely(self, tmp_path):
+        """Test config files cannot construct arbitrary Python objects."""
+        path = tmp_path / "config.yaml"
+        path.write_text("extra: !!python/object/apply:os.getcwd []\n")
+
+        config = load_config(str(path))
+
+        assert "extra" not in config
+
+    def test_loaded_configs_are_independent(self, tmp_path):
+        """Test nested dicts and lists are not shared between loads."""
+        path = tmp_path / "config.yaml"
+        path.write_text("extra:\n  items: [1, {nested: 2}]\n  when: 2024-01-01\n")
+
+        first = load_config(str(path))
+        first["extra"]["items"][1]["nested"] = 99
+        first["extra"]["items"].append(3)
+        first["ui"]["port"] = 1
+
+        second = load_config(str(path))
+        assert second["extra"]["items"] == [1, {"nested": 2}]
+        assert second["extra"]["when"] == first["extra"]["when"]
+        assert second["ui"]["port"] == 7860
+
+    def test_cached_result_is_not_shared(self, config_file):
+        """Test mutating a loaded config does not affect later loads."""
+        config = load_config(str(config_file))
+        config["extra"]["value"] = 99
+
+        assert load_config(str(config_file))["extra"] == {"value": 1}
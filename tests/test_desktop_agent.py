@@ -1,10 +1,20 @@
 """
 Tests for the Desktop Agent implementation.
 """
+import asyncio
+import json
+
+import aiohttp
 import pytest
 from unittest.mock import patch, AsyncMock
 
-from qwen_assistant.agents.desktop import DesktopAgent
+from qwen_assistant.agents import desktop
+from qwen_assistant.agents.desktop import (
+    DesktopAgent,
+    clear_read_cache,
+    close_session,
+    get_session,
+)
 
 
 @pytest.fixture
@@ -34,6 +44,14 @@ def desktop_agent(desktop_agent_config, model_config):
     return agent
 
 
+@pytest.fixture(autouse=True)
+def reset_read_cache():
+    """Keep cached MCP reads from leaking between tests."""
+    clear_read_cache()
+    yield
+    clear_read_cache()
+
+
 @pytest.fixture
 def mock_mcp(monkeypatch):
     """Patch DesktopAgent._mcp_call to avoid network access."""
@@ -53,14 +71,21 @@ class TestDesktopAgent:
         assert desktop_agent.name == "DesktopAgent"
         assert "file system" in desktop_agent.description.lower()
 
+    def test_no_instance_dict(self, desktop_agent):
+        """Test agents store their attributes in slots."""
+        assert not hasattr(desktop_agent, "__dict__")
+        with pytest.raises(AttributeError):
+            desktop_agent.unknown_attribute = True
+
     def test_capabilities(self, desktop_agent):
         """Test agent capabilities."""
         capabilities = desktop_agent.capabilities
-        assert isinstance(capabilities, list)
+        assert isinstance(capabilities, tuple)
         assert len(capabilities) > 0
         assert "Execute terminal commands" in capabilities
         assert "Read and write files" in capabilities
         assert "Search for files and code" in capabilities
+        assert capabilities is DesktopAgent.CAPABILITIES
 
     @pytest.mark.parametrize(
         "query,expected_confidence",
@@ -77,6 +102,33 @@ class TestDesktopAgent:
         confidence = desktop_agent.can_handle({"query": query})
         assert confidence == expected_confidence
 
+    @pytest.mark.parametrize(
+        "query,expected_confidence",
+        [
+            ("open the folder", 0.2),
+            ("find the script in this folder", 0.6),
+            ("run the script on my local computer", 0.8),
+            ("filexecute", 0.4),
+        ],
+    )
+    def test_can_handle_medium_keywords(
+        self, desktop_agent, query, expected_confidence
+    ):
+        """Test each distinct medium keyword adds to the confidence."""
+        confidence = desktop_agent.can_handle({"query": query})
+        assert confidence == pytest.approx(expected_confidence)
+
+    def test_can_handle_is_memoized(self, desktop_agent):
+        """Test repeated queries reuse the cached confidence score."""
+        DesktopAgent._score_query.cache_clear()
+
+        desktop_agent.can_handle({"query": "List Directory contents"})
+        desktop_agent.can_handle({"query": "list directory contents"})
+
+        info = DesktopAgent._score_query.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
     @pytest.mark.asyncio
     async def test_execute_command_calls_mcp(self, desktop_agent, mock_mcp):
         result = await desktop_agent.execute_command("ls")
@@ -89,6 +141,147 @@ class TestDesktopAgent:
         mock_mcp.assert_called_once_with("read_file", {"path": "foo.txt"})
         assert result["success"] is True
 
+    @pytest.mark.asyncio
+    async def test_execute_batch_single_request(self, desktop_agent, mock_mcp):
+        """Test independent calls are sent as one batch request."""
+        mock_mcp.return_value = {
+            "success": True,
+            "results": [{"success": True, "content": "x"}, {"success": True}],
+        }
+
+        results = await desktop_agent.execute_batch(
+            [("read_file", {"path": "a.txt"}), ("get_file_info", {"path": "a.txt"})]
+        )
+
+        mock_mcp.assert_called_once_with(
+            "batch_execute",
+            {
+                "ops": [
+                    {"tool": "read_file", "params": {"path": "a.txt"}},
+                    {"tool": "get_file_info", "params": {"path": "a.txt"}},
+                ],
+                "maxConcurrent": 8,
+                "stopOnError": False,
+            },
+        )
+        assert results[0]["content"] == "x"
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_error(self, desktop_agent, mock_mcp):
+        """Test a failed batch request yields one error per call."""
+        mock_mcp.return_value = {"error": "connection refused", "success": False}
+
+        results = await desktop_agent.execute_batch(
+            [("read_file", {"path": "a.txt"}), ("list_directory", {"path": "."})]
+        )
+
+        assert results == [
+            {"error": "connection refused", "success": False},
+            {"error": "connection refused", "success": False},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_reads_are_cached(self, desktop_agent, mock_mcp):
+        """Test repeated idempotent reads of a path reuse the first result."""
+        await desktop_agent.read_file("foo.txt")
+        await desktop_agent.read_file("foo.txt")
+        await desktop_agent.get_file_info("foo.txt")
+        await desktop_agent.list_directory("src")
+        await desktop_agent.list_directory("src")
+
+        assert mock_mcp.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_failed_reads_are_not_cached(self, desktop_agent, mock_mcp):
+        """Test failed reads are retried on the next call."""
+        mock_mcp.return_value = {"success": False, "error": "not found"}
+
+        await desktop_agent.read_file("foo.txt")
+        await desktop_agent.read_file("foo.txt")
+
+        assert mock_mcp.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cached_reads_expire(self, desktop_agent, mock_mcp, monkeypatch):
+        """Test cached reads are refreshed once their TTL has passed."""
+        now = [1000.0]
+        monkeypatch.setattr(
+            "qwen_assistant.agents.desktop.time.monotonic", lambda: now[0]
+        )
+
+        await desktop_agent.read_file("foo.txt")
+        now[0] += 60
+        await desktop_agent.read_file("foo.txt")
+
+        assert mock_mcp.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_reads(self, desktop_agent, mock_mcp):
+        """Test writing a file drops its cached reads and directory listings."""
+        await desktop_agent.read_file("foo.txt")
+        await desktop_agent.read_file("bar.txt")
+        await desktop_agent.list_directory(".")
+        await desktop_agent.write_file("foo.txt", "new content")
+        mock_mcp.reset_mock()
+
+        await desktop_agent.read_file("foo.txt")
+        await desktop_agent.read_file("bar.txt")
+        await desktop_agent.list_directory(".")
+
+        assert [c.args[1]["path"] for c in mock_mcp.await_args_list] == [
+            "foo.txt",
+            ".",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cached_reads_are_copies(self, desktop_agent, mock_mcp):
+        """Test mutating a returned read leaves the cached result intact."""
+        mock_mcp.return_value = {"success": True, "content": {"lines": ["a"]}}
+
+        first = await desktop_agent.read_file("foo.txt")
+        first["content"]["lines"].append("mutated")
+        second = await desktop_agent.read_file("foo.txt")
+        second["content"]["lines"].append("mutated again")
+        third = await desktop_agent.read_file("foo.txt")
+
+        assert mock_mcp.await_count == 1
+        assert third == {"success": True, "content": {"lines": ["a"]}}
+
+    @pytest.mark.asyncio
+    async def test_reads_in_flight_during_write_are_not_cached(
+        self, desktop_agent, mock_mcp
+    ):
+        """Test a read that overlaps a write doesn't cache its old result."""
+        write_started = asyncio.Event()
+
+        async def fake_mcp(tool_name, params):
+            if tool_name == "read_file":
+                # The write happens while the read is on the wire
+                await write_started.wait()
+                return {"success": True, "content": "old"}
+            write_started.set()
+            return {"success": True}
+
+        mock_mcp.side_effect = fake_mcp
+        read = asyncio.ensure_future(desktop_agent.read_file("foo.txt"))
+        await asyncio.sleep(0)
+        await desktop_agent.write_file("foo.txt", "new")
+        assert (await read)["content"] == "old"
+
+        mock_mcp.side_effect = None
+        mock_mcp.return_value = {"success": True, "content": "new"}
+        assert (await desktop_agent.read_file("foo.txt"))["content"] == "new"
+
+    @pytest.mark.asyncio
+    async def test_commands_invalidate_cached_reads(self, desktop_agent, mock_mcp):
+        """Test running a command drops all cached reads."""
+        await desktop_agent.read_file("foo.txt")
+        await desktop_agent.execute_command("rm foo.txt")
+        await desktop_agent.read_file("foo.txt")
+
+        assert mock_mcp.await_count == 3
+
     @pytest.mark.asyncio
     async def test_handle_request_execute_command(self, desktop_agent, mock_mcp):
         """Test handling execute command request."""
@@ -102,6 +295,50 @@ class TestDesktopAgent:
         assert "Executed command" in response["message"]
         mock_mcp.assert_called_once_with("execute_command", {"command": "ls -la"})
 
+    @pytest.mark.asyncio
+    async def test_handle_request_matches_keywords_case_insensitively(
+        self, desktop_agent, mock_mcp
+    ):
+        """Test keyword dispatch ignores case and extracts the command."""
+        response = await desktop_agent.handle_request({"query": "Run ls -la"}, {})
+
+        assert response["message"] == "Executed command: ls -la"
+        mock_mcp.assert_called_once_with("execute_command", {"command": "ls -la"})
+
+    @pytest.mark.asyncio
+    async def test_handle_request_matches_whole_words(self, desktop_agent, mock_mcp):
+        """Test single-word keywords don't match inside other words."""
+        response = await desktop_agent.handle_request(
+            {"query": "what tools are running"}, {}
+        )
+
+        assert response["message"] == "Processing desktop request: what tools are running"
+        mock_mcp.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_request_explicit_action_wins(self, desktop_agent, mock_mcp):
+        """Test an explicit action is used even if the query suggests another."""
+        request = {"query": "run it", "action": "list_directory", "directory": "src"}
+
+        response = await desktop_agent.handle_request(request, {})
+
+        assert response["message"] == "Listed directory: src"
+        mock_mcp.assert_called_once_with("list_directory", {"path": "src"})
+
+    @pytest.mark.parametrize(
+        "query,expected_action",
+        [
+            ("list and read the file", "read_file"),
+            ("search code then save it", "write_file"),
+            ("find files and ls", "search_files"),
+            ("show file info", "get_file_info"),
+            ("hello there", None),
+        ],
+    )
+    def test_resolve_action_priority(self, query, expected_action):
+        """Test keyword-based actions follow the dispatch priority."""
+        assert DesktopAgent._resolve_action(query) == expected_action
+
     @pytest.mark.asyncio
     async def test_handle_request_read_file(self, desktop_agent, mock_mcp):
         """Test handling read file request."""
@@ -114,11 +351,71 @@ class TestDesktopAgent:
         assert "Read file" in response["message"]
         mock_mcp.assert_called_once_with("read_file", {"path": "file.txt"})
 
+    @pytest.mark.asyncio
+    async def test_handle_requests_concurrently(self, desktop_agent, mock_mcp):
+        """Test several requests are handled together, preserving order."""
+        requests = [
+            {"query": "", "action": "read_file", "file_path": "a.txt"},
+            {"query": "", "action": "list_directory", "directory": "src"},
+        ]
+
+        responses = await desktop_agent.handle_requests(requests, {})
+
+        assert [r["message"] for r in responses] == [
+            "Read file: a.txt",
+            "Listed directory: src",
+        ]
+        assert mock_mcp.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_handle_requests_isolates_failures(self, desktop_agent, mock_mcp):
+        """Test an unexpected error in one request doesn't fail the others."""
+        calls = 0
+
+        async def flaky_handle_request(self, request, context):
+            nonlocal calls
+            calls += 1
+            if request["query"] == "boom":
+                raise RuntimeError("boom")
+            return {"success": True}
+
+        with patch.object(DesktopAgent, "handle_request", flaky_handle_request):
+            responses = await desktop_agent.handle_requests(
+                [{"query": "ok"}, {"query": "boom"}], {}
+            )
+
+        assert calls == 2
+        assert responses[0] == {"success": True}
+        assert responses[1]["success"] is False
+        assert "boom" in responses[1]["message"]
+
+    @pytest.mark.asyncio
+    async def test_handle_requests_isolates_cancellation(self, desktop_agent, mock_mcp):
+        """Test a cancelled request is reported as an error response."""
+
+        async def cancelling_handle_request(self, request, context):
+            if request["query"] == "cancel":
+                raise asyncio.CancelledError()
+            return {"success": True}
+
+        with patch.object(DesktopAgent, "handle_request", cancelling_handle_request):
+            responses = await desktop_agent.handle_requests(
+                [{"query": "ok"}, {"query": "cancel"}], {}
+            )
+
+        assert responses[0] == {"success": True}
+        assert responses[1]["success"] is False
+        assert responses[1]["agent"] == DesktopAgent.NAME
+
     @pytest.mark.asyncio
     async def test_mcp_call(self, desktop_agent, monkeypatch):
         """Test MCP API call without real network access."""
 
-        async def fake_post(self, url, json):
+        sent = {}
+
+        def fake_post(self, url, data=None, headers=None):
+            sent.update(url=url, data=data, headers=headers)
+
             class FakeResp:
                 async def __aenter__(self_inner):
                     return self_inner
@@ -126,14 +423,141 @@ class TestDesktopAgent:
                 async def __aexit__(self_inner, exc_type, exc, tb):
                     pass
 
-                async def json(self_inner):
-                    return {"success": True, "result": "test result"}
+                async def read(self_inner):
+                    return b'{"success": true, "result": "test result"}'
 
             return FakeResp()
 
         monkeypatch.setattr("aiohttp.ClientSession.post", fake_post)
 
         result = await desktop_agent._mcp_call("test_tool", {"param": "value"})
+        await close_session()
 
         assert result["success"] is True
         assert result["result"] == "test result"
+        assert sent["url"] == "http://localhost:9000/api/v1/execute"
+        assert sent["headers"]["Content-Type"] == "application/json"
+        assert json.loads(sent["data"]) == {
+            "tool": "test_tool",
+            "params": {"param": "value"},
+        }
+
+    @pytest.mark.asyncio
+    async def test_agents_share_session(self, desktop_agent_config, model_config):
+        """Test agents share one pooled HTTP session until the last cleanup."""
+        first = DesktopAgent(desktop_agent_config, model_config)
+        second = DesktopAgent(desktop_agent_config, model_config)
+
+        await first.prepare()
+        await second.prepare()
+        session = first.session
+        assert session is second.session
+        assert session is get_session()
+
+        await first.cleanup()
+        assert first.session is None
+        assert not session.closed
+
+        await second.cleanup()
+        assert session.closed
+        assert get_session() is not session
+        await close_session()
+
+    @pytest.mark.asyncio
+    async def test_unprepared_call_holds_session(
+        self, desktop_agent_config, model_config, monkeypatch
+    ):
+        """Test a call made without prepare() keeps the session open until done."""
+        prepared = DesktopAgent(desktop_agent_config, model_config)
+        unprepared = DesktopAgent(desktop_agent_config, model_config)
+        await prepared.prepare()
+        session = prepared.session
+        closed_mid_request = []
+
+        def fake_post(self, url, data=None, headers=None):
+            class FakeResp:
+                async def __aenter__(self_inner):
+                    # Another agent finishes while this request is in flight
+                    await prepared.cleanup()
+                    closed_mid_request.append(session.closed)
+                    return self_inner
+
+                async def __aexit__(self_inner, exc_type, exc, tb):
+                    pass
+
+                async def read(self_inner):
+                    return b'{"success": true}'
+
+            return FakeResp()
+
+        monkeypatch.setattr("aiohttp.ClientSession.post", fake_post)
+
+        result = await unprepared._mcp_call("test_tool", {})
+
+        assert result == {"success": True}
+        assert closed_mid_request == [False]
+        # The session stays shared until close_session()
+        assert get_session() is session
+        await close_session()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_unix_socket_endpoint(self, model_config):
+        """Test unix:// endpoints get their own session over a Unix socket."""
+        agent = DesktopAgent({"mcp_endpoint": "unix:///tmp/mcp.sock"}, model_config)
+        assert agent._execute_url == "http://localhost/api/v1/execute"
+
+        await agent.prepare()
+        try:
+            assert isinstance(agent.session.connector, aiohttp.UnixConnector)
+            assert agent.session.connector.path == "/tmp/mcp.sock"
+            assert agent.session is not get_session()
+        finally:
+            await agent.cleanup()
+            await close_session()
+
+
+def test_sessions_from_another_loop_are_closed():
+    """Test sessions left over from a finished event loop are closed."""
+
+    async def open_session():
+        return get_session()
+
+    async def reopen_session():
+        session = get_session()
+        await asyncio.gather(*desktop._CLOSING)
+        await close_session()
+        return session
+
+    old = asyncio.run(open_session())
+    new = asyncio.run(reopen_session())
+
+    assert new is not old
+    assert old.closed
+    assert new.closed
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_json_round_trip(monkeypatch, use_orjson):
+    """Test MCP payloads round-trip with and without orjson installed."""
+    from qwen_assistant.agents import desktop
+
+    if not use_orjson:
+        monkeypatch.setattr(desktop, "orjson", None)
+
+    payload = {"tool": "read_file", "params": {"path": "café.txt"}}
+    data = desktop._dumps(payload)
+
+    assert isinstance(data, bytes)
+    assert desktop._loads(data) == payload
+
+
+def test_lazy_package_import():
+    """Test agents are importable from the package without eager imports."""
+    import qwen_assistant.agents as agents
+
+    assert agents.DesktopAgent is DesktopAgent
+    assert "DesktopAgent" in agents.__all__
+
+    with pytest.raises(AttributeError):
+        agents.UnknownAgent
@@ -0,0 +1,43 @@
+"""
+Tests for the command line entry point.
+"""
+import subprocess
+import sys
+
+import pytest
+
+from qwen_assistant.__main__ import _parse_config_path
+
+
+class TestParseConfigPath:
+    """Test suite for command line parsing."""
+
+    def test_no_arguments_uses_env(self, monkeypatch):
+        """Test the config path defaults to QWEN_CONFIG_PATH."""
+        monkeypatch.setenv("QWEN_CONFIG_PATH", "/etc/qwen.yaml")
+        assert _parse_config_path([]) == "/etc/qwen.yaml"
+
+    @pytest.mark.parametrize(
+        "argv",
+        [["--config", "custom.yaml"], ["--config=custom.yaml"]],
+    )
+    def test_config_option(self, argv):
+        """Test both forms of the --config option."""
+        assert _parse_config_path(argv) == "custom.yaml"
+
+    def test_invalid_arguments_exit(self):
+        """Test unknown arguments are rejected by argparse."""
+        with pytest.raises(SystemExit):
+            _parse_config_path(["--unknown"])
+
+
+def test_entry_point_imports_ui_lazily():
+    """Test importing the entry point doesn't import the UI stack."""
+    code = (
+        "import sys, qwen_assistant.__main__; "
+        "print('qwen_assistant.ui' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"